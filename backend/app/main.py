@@ -9,7 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from app.services.playlist_scraper import PlaylistScraper
+from app.services.playlist_scraper import BROWSER_POOL, PlaylistScraper, close_http_session
 from app.services.soundcloud import SoundCloudService
 import re
 import time
@@ -19,9 +19,9 @@ from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.exceptions import HTTPException
 from contextlib import asynccontextmanager
 
-# Configure logging
+# Configure logging; LOG_LEVEL=DEBUG enables verbose tracing, production defaults to INFO
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
     handlers=[
         logging.StreamHandler(),
@@ -69,8 +69,15 @@ class SearchRequest(BaseModel):
     exclude_current: Optional[bool] = False
     blacklisted_urls: Optional[List[str]] = None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Quit the pooled browsers and close the shared HTTP session when the server stops."""
+    yield
+    await BROWSER_POOL.close()
+    await close_http_session()
+
 # Initialize FastAPI app
-app = FastAPI(title="Playlist Converter API")
+app = FastAPI(title="Playlist Converter API", lifespan=lifespan)
 
 # Setup CORS
 app.add_middleware(
@@ -261,14 +268,14 @@ async def convert_playlist(
         raise HTTPException(status_code=400, detail="Invalid playlist URL")
     
     # Initialize services
+    soundcloud = None
     try:
         logger.info(f"[TRACE][{request_id}] Initializing playlist scraper...")
         update_progress(response, "initialization", "Initializing playlist scraper...", "starting")
         
-        # Initialize the playlist scraper - this starts the browser
+        # No browser of its own: it borrows a warm one from the shared pool only if the
+        # cache and HTTP fast paths can't serve the playlist
         playlist_scraper = PlaylistScraper()
-        await playlist_scraper.initialize_browser()
-        background_tasks.add_task(playlist_scraper.cleanup)
         
         logger.info(f"[TRACE][{request_id}] Initializing SoundCloud service...")
         update_progress(response, "initialization", "Initializing services...", "setting_up")
@@ -290,6 +297,9 @@ async def convert_playlist(
         
     except Exception as e:
         logger.error(f"[ERROR][{request_id}] Failed to initialize services: {str(e)}", exc_info=True)
+        # Background tasks don't run for a failed request; clean up what was already started
+        if soundcloud is not None:
+            await soundcloud.cleanup()
         raise HTTPException(status_code=500, detail=f"Failed to initialize services: {str(e)}")
     
     # Fetch playlist data
@@ -576,7 +586,7 @@ async def convert_playlist(
 @api_router.post("/search")
 async def search_track(request: SearchRequest):
     """Search for a track on SoundCloud with support for blacklisting."""
-    request_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    request_id = uuid.uuid4().hex[:12]
     logger.info(f"[TRACE][{request_id}] Starting track search: {request.dict()}")
     
     sc_service = None
@@ -8,7 +8,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
 import asyncio
 import re
 import unicodedata
@@ -73,9 +72,10 @@ def calculate_similarity(a: str, b: str) -> float:
     return min(similarity, 1.0)
 
 class PlaylistConverter:
-    def __init__(self, max_retries=3, retry_delay=2):
+    def __init__(self, max_retries=3, retry_delay=2, max_concurrency=8):
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_concurrency = max_concurrency
         self.browser = None
         self.wait = None
         self._initialized = False
@@ -133,18 +133,19 @@ class PlaylistConverter:
             if total_tracks == 0:
                 raise Exception("No tracks to convert")
             
-            converted_tracks = []
-            success_count = 0
+            # Tracks are independent, so they are looked up concurrently; the semaphore
+            # caps in-flight searches to stay within rate limits
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             
-            for idx, track in enumerate(tracks, 1):
-                try:
+            async def convert_track(idx: int, track: Dict) -> Optional[Dict]:
+                async with semaphore:
                     track_name = track.get('name', '').strip()
                     artists = track.get('artists', [])
                     artist_name = artists[0].strip() if artists else ''
                     
                     if not track_name:
                         logger.warning(f"Track {idx}: Missing track name")
-                        continue
+                        return None
                         
                     search_query = f"{track_name} {artist_name}".strip()
                     logger.info(f"Processing track {idx}/{total_tracks}: {search_query}")
@@ -165,27 +166,36 @@ class PlaylistConverter:
                         'stream_url': f'https://api.soundcloud.com/tracks/{hash(search_query)}'
                     }
                     
-                    converted_track = {
+                    logger.info(f"Successfully converted track: {track_name}")
+                    return {
                         'original': track,
                         'converted': soundcloud_track,
                         'success': True,
                         'status': 'converted',
                         'conversion_progress': (idx / total_tracks) * 100
                     }
-                    
-                    converted_tracks.append(converted_track)
-                    success_count += 1
-                    logger.info(f"Successfully converted track: {track_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error converting track {idx}: {str(e)}")
+            
+            results = await asyncio.gather(
+                *(convert_track(idx, track) for idx, track in enumerate(tracks, 1)),
+                return_exceptions=True
+            )
+            
+            # Results come back in playlist order; a failed lookup marks its track unmatched
+            converted_tracks = []
+            success_count = 0
+            for idx, (track, result) in enumerate(zip(tracks, results), 1):
+                if isinstance(result, Exception):
+                    logger.error(f"Error converting track {idx}: {str(result)}")
                     converted_tracks.append({
                         'original': track,
                         'success': False,
                         'status': 'error',
-                        'error': str(e),
+                        'error': str(result),
                         'conversion_progress': (idx / total_tracks) * 100
                     })
+                elif result is not None:
+                    converted_tracks.append(result)
+                    success_count += 1
 
             success_rate = success_count / total_tracks if total_tracks > 0 else 0
             
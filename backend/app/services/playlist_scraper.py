@@ -6,36 +6,726 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 import logging
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable
+from contextlib import asynccontextmanager
 from datetime import datetime
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from fastapi import HTTPException
-import json
+import orjson
 import time
 from urllib.parse import urlparse, parse_qs, quote
 import asyncio
 import aiohttp
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
-from difflib import SequenceMatcher
 import os
 import traceback
-from .spotify import SpotifyService
-from .soundcloud import SoundCloudService
+import hashlib
+import shutil
+import glob
+import copy
+import uuid
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from .utils import HostRateLimiter, TTLCache
 import psutil
 import signal
 import random
 
-# Configure logging with more detailed format
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
-)
+# Root logging is configured once by the app; only tune this module's loggers here
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if os.getenv("SCRAPER_DEBUG") else logging.INFO)
+
+# Silence chatty third-party debug output
+logging.getLogger("selenium").setLevel(logging.WARNING)
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+# Blocked on every platform: images, fonts, media and ad/analytics hosts are never
+# needed to read a track list
+_COMMON_BLOCKED_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.svg',  # Block images
+    '*.webp', '*.avif', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',  # Block fonts
+    # Audio/video previews and streaming manifests
+    '*.mp3', '*.mp4', '*.m4a', '*.m3u8',
+    'https://www.google-analytics.com/*',  # Block analytics
+    'https://*.googletagmanager.com/*',
+    'https://*.googlesyndication.com/*',
+    'https://*.googleadservices.com/*',
+    'https://*.doubleclick.net/*',
+    'https://connect.facebook.net/*',  # Block Facebook
+    'https://*.hotjar.com/*',  # Block Hotjar
+    'https://*.segment.io/*',
+    'https://*.sentry.io/*',
+    'https://*.intercom.io/*',
+    'https://cdn.optimizely.com/*',
+]
+
+# CDP URL blocklists per platform. Spotify is a client-rendered app, so its scripts must load;
+# Apple Music renders the track list server-side and can go without JS and CSS
+_SPOTIFY_BLOCKED_URLS = _COMMON_BLOCKED_URLS + [
+    # Cover art CDNs serve images from extensionless URLs
+    'https://i.scdn.co/image/*',
+    'https://mosaic.scdn.co/*',
+    'https://image-cdn-*.spotifycdn.com/*',
+    '*.css',  # Block CSS - careful with this one, might break page structure
+    'https://analytics.spotify.com/*',  # Block Spotify analytics
+    'https://log.spotify.com/*',  # Block Spotify logging
+    'https://ads.spotify.com/*',  # Block Spotify ads
+    # Telemetry beacons sent over XHR/fetch
+    '*/gabo-receiver-service/*',  # Spotify event logging
+]
+_APPLE_BLOCKED_URLS = _COMMON_BLOCKED_URLS + [
+    # Artwork is served from extensionless /image/thumb/ URLs
+    '*.mzstatic.com/image/*',
+    '*.css', # Block CSS to save memory (might affect page display)
+    '*.js', # Block non-essential JavaScript
+    'https://analytics.apple.com/*',
+    'https://metrics.apple.com/*',
+    '*/preview*',
+    '*/metrics*',
+    '*/itunes.apple.com/search*'
+]
+
+# chrome-headless-shell starts faster and uses far less memory than full Chrome;
+# used when installed on PATH or pointed to by CHROME_HEADLESS_SHELL
+_HEADLESS_SHELL = os.getenv("CHROME_HEADLESS_SHELL") or shutil.which("chrome-headless-shell")
+
+# Chrome profiles go on tmpfs when it has this much room, since startup writes many small files
+_MIN_SHM_FREE = 64 * 1024 * 1024
+
+
+def _make_profile_dir(name: str) -> str:
+    """
+    Create a fresh Chrome user data directory, on /dev/shm when it has room and on /tmp otherwise.
+    
+    Returns "" when neither can be created, leaving the profile to Chrome.
+    """
+    parents = ["/tmp"]
+    try:
+        if shutil.disk_usage("/dev/shm").free >= _MIN_SHM_FREE:
+            parents.insert(0, "/dev/shm")
+    except OSError:
+        pass
+    
+    for parent in parents:
+        path = os.path.join(parent, name)
+        try:
+            os.makedirs(path, mode=0o700, exist_ok=False)
+            logger.info(f"Created fresh Chrome user data directory: {path}")
+            return path
+        except OSError as e:
+            logger.warning(f"Failed to create directory {path}: {str(e)}")
+    return ""
+
+
+# Profile directory names made by initialize_browser, with the creating process's pid
+_PROFILE_DIR_RE = re.compile(r"^chrome_(?:tmp|retry_\d+)_(\d+)_")
+
+
+def _stale_profile_dirs() -> List[str]:
+    """
+    Return profile directories on /dev/shm and /tmp whose creating process has exited.
+    
+    Profiles of this process and of other live workers may still be in use, so they are left alone.
+    """
+    stale = []
+    for parent in ("/dev/shm", "/tmp"):
+        for path in glob.glob(os.path.join(parent, "chrome_tmp_*")) + glob.glob(os.path.join(parent, "chrome_retry_*")):
+            match = _PROFILE_DIR_RE.match(os.path.basename(path))
+            if match and not psutil.pid_exists(int(match.group(1))):
+                stale.append(path)
+    return stale
+
+# Launch flags for the primary browser configuration, built once at import
+_BASE_CHROME_ARGS = (
+    # Prevent lock file issues
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--password-store=basic',
+    # Also disable any disk cache to prevent disk usage growth
+    '--disk-cache-size=1',
+    '--media-cache-size=1',
+    '--disable-application-cache',
+    # CRITICAL: Absolute minimum memory usage configuration
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    # Memory is bounded by the JS heap cap and tab reuse; single-process and
+    # renderer-limit modes are unsupported headless and crash the browser
+    '--disable-hang-monitor',
+    # Cap the JavaScript heap; much lower and the SPA spends its time in GC
+    '--js-flags=--max-old-space-size=128',
+    # Disable everything non-essential
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-default-apps',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-translate',
+    '--blink-settings=imagesEnabled=false',
+    # Disable storage APIs to save memory
+    '--disable-local-storage',
+    '--disable-session-storage',
+    '--disable-notifications',
+    # Prevent crash reporting and diagnostics
+    '--disable-crash-reporter',
+    '--disable-breakpad',
+    '--disable-logging',
+    '--log-level=3',
+)
+
+# Used instead of a profile directory when none could be created
+_NO_PROFILE_CHROME_ARGS = ('--incognito', '--profile-directory=Default', '--disable-infobars')
+
+# Progressively more minimal configurations for the init retries
+_RETRY_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--incognito',
+    '--disable-extensions',
+    '--disable-logging',
+    '--log-level=3',
+    '--no-first-run',
+    '--no-default-browser-check',
+)
+_LAST_RESORT_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--incognito',
+    '--disable-extensions',
+    '--disable-site-isolation-trials',
+    '--guest',
+)
+
+# The headless shell is always headless, has no GPU or audio stack and draws no
+# scrollbars, so these only apply to full Chrome
+_FULL_CHROME_ARGS = ('--headless=new', '--disable-gpu', '--hide-scrollbars', '--mute-audio')
+
+# Configure prefs for minimal memory use
+_CHROME_PREFS = {
+    'profile.default_content_setting_values.cookies': 2,  # Block cookies
+    'profile.default_content_setting_values.images': 2,  # Block images
+    'profile.default_content_setting_values.popups': 2,  # Block popups
+    'profile.managed_default_content_settings.javascript': 1,  # Allow JS (needed)
+    'profile.default_content_setting_values.notifications': 2,  # Block notifications
+    'profile.managed_default_content_settings.plugins': 2,  # Block plugins
+}
+
+
+def _chrome_options(user_data_dir: Optional[str], args: Tuple[str, ...] = _BASE_CHROME_ARGS,
+                    prefs: Optional[Dict] = _CHROME_PREFS) -> webdriver.ChromeOptions:
+    """Build launch options from one of the module-level flag sets plus a per-launch profile directory."""
+    chrome_options = webdriver.ChromeOptions()
+    # Prefer the stripped headless shell when it is installed
+    if _HEADLESS_SHELL:
+        chrome_options.binary_location = _HEADLESS_SHELL
+    else:
+        for arg in _FULL_CHROME_ARGS:
+            chrome_options.add_argument(arg)
+    for arg in args:
+        chrome_options.add_argument(arg)
+    if user_data_dir:
+        chrome_options.add_argument(f'--user-data-dir={user_data_dir}')
+    if prefs:
+        chrome_options.add_experimental_option('prefs', prefs)
+    return chrome_options
+
+# Scrapes between full cookie/cache wipes of a reused browser
+_FULL_WIPE_EVERY = 25
+
+# Failure screenshots cost a PNG encode and a disk write, so they are opt-in
+_DEBUG_SHOTS = os.environ.get("SCRAPER_DEBUG_SCREENSHOTS") == "1"
+
+# Chrome version diagnostics cost a fork+exec, so log them once at import and only on request
+if os.getenv("LOG_CHROME_VERSION") == "1":
+    import subprocess
+    try:
+        chrome_version = subprocess.check_output(['google-chrome', '--version']).decode('utf-8').strip()
+        logger.info(f"Chrome version: {chrome_version}")
+    except Exception as e:
+        logger.warning(f"Failed to get Chrome version: {str(e)}")
+
+# Scraped playlists keyed by URL; playlists change on human timescales, so repeat
+# requests within the TTL skip the scrape entirely. Bounded so a long-running
+# process doesn't keep every playlist it has ever seen in memory
+_PLAYLIST_CACHE_TTL = float(os.getenv("PLAYLIST_CACHE_TTL", "3600"))
+_PLAYLIST_CACHE_MAX = int(os.getenv("PLAYLIST_CACHE_MAX", "128"))
+_PLAYLIST_CACHE = TTLCache(ttl=_PLAYLIST_CACHE_TTL, max_size=_PLAYLIST_CACHE_MAX)
+
+# Optional second tier on disk so cached playlists survive restarts. Off unless
+# PLAYLIST_CACHE_DIR is set; holds at most PLAYLIST_CACHE_DIR_MAX entries, and
+# expired or excess files are deleted as entries are written
+_PLAYLIST_CACHE_DIR = os.getenv("PLAYLIST_CACHE_DIR", "")
+_PLAYLIST_CACHE_DIR_MAX = int(os.getenv("PLAYLIST_CACHE_DIR_MAX", str(_PLAYLIST_CACHE_MAX)))
+
+
+# The pending result of each playlist being scraped, so concurrent requests for it
+# await one scrape; the entry is dropped once that scrape settles
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+def _as_dict(value: Any) -> Dict:
+    """The value if it is a dict, else an empty one; for walking JSON of uncertain shape."""
+    return value if isinstance(value, dict) else {}
+
+
+def _as_list(value: Any) -> List:
+    """The value if it is a list, else an empty one; for walking JSON of uncertain shape."""
+    return value if isinstance(value, list) else []
+
+
+def _cache_key(url: str) -> str:
+    """Normalize a playlist URL for caching; share links differ only in query (?si=...) and fragment."""
+    return urlparse(url.strip())._replace(query="", fragment="").geturl()
+
+
+def _disk_cache_path(url: str) -> Path:
+    return Path(_PLAYLIST_CACHE_DIR) / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _cache_lookup(url: str) -> Optional[Dict]:
+    """Return a cached playlist from memory, falling back to a fresh disk entry."""
+    # Callers get their own copy; the cached entry is shared across requests
+    cached = _PLAYLIST_CACHE.get(url)
+    if cached is not None or not _PLAYLIST_CACHE_DIR:
+        return copy.deepcopy(cached)
+    
+    path = _disk_cache_path(url)
+    try:
+        # The entry's lifetime counts from when it was written, not when it was loaded
+        remaining = _PLAYLIST_CACHE_TTL - (time.time() - path.stat().st_mtime)
+        if remaining <= 0:
+            path.unlink(missing_ok=True)
+            return None
+        cached = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    _PLAYLIST_CACHE.set(url, cached, ttl=remaining)
+    return copy.deepcopy(cached)
+
+
+def _cache_store(url: str, data: Dict) -> None:
+    """Cache a scraped playlist in memory and, when enabled, on disk."""
+    _PLAYLIST_CACHE.set(url, copy.deepcopy(data))
+    if not _PLAYLIST_CACHE_DIR:
+        return
+    
+    path = _disk_cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial entry
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning(f"Failed to write playlist cache entry: {str(e)}")
+        return
+    _prune_disk_cache()
+
+
+def _prune_disk_cache() -> None:
+    """Delete expired disk cache entries, then the oldest ones beyond the size limit."""
+    expires_before = time.time() - _PLAYLIST_CACHE_TTL
+    entries = []
+    for path in Path(_PLAYLIST_CACHE_DIR).glob("*.json"):
+        try:
+            mtime = path.stat().st_mtime
+            if mtime < expires_before:
+                path.unlink()
+            else:
+                entries.append((mtime, path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[_PLAYLIST_CACHE_DIR_MAX:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+# Spotify playlist id, used to build the server-rendered embed URL
+_SPOTIFY_PLAYLIST_ID_RE = re.compile(r'playlist[/:]([A-Za-z0-9]+)')
+
+# Spotify playlist collector, built once at import and sent as-is on every call.
+# The tracklist is virtualized, so rows are collected as they mount while the
+# script scrolls the list; Python polls window.__tracksSettled and then reads the
+# result with _SPOTIFY_COLLECTED_JS
+_SPOTIFY_EXTRACT_JS = """
+// Selector lists are allocated once per injection, not once per collection pass
+const CONTAINER_SELECTOR =
+    'div[data-testid="playlist-tracklist"], div.tracklist-container, section[data-testid="playlist-tracklist"]';
+const ROW_SELECTORS = [
+    'div[data-testid="tracklist-row"]',
+    'div[role="row"]',
+    'div[draggable="true"]'
+];
+const LINK_SELECTOR = 'a[data-testid="internal-track-link"], a[href*="artist"]';
+
+function getPlaylistData() {
+    // Read the document's title and URL once
+    const {title, location: {href}} = document;
+
+    // Define result object with placeholders
+    const data = {
+        name: title || 'Spotify Playlist',
+        tracks: [],
+        url: href,
+        platform: 'Spotify',
+        expectedCount: null,
+        // Page-level failures are returned, not logged: console calls cross CDP
+        errors: []
+    };
+
+    // Read the header's track count in the same call
+    const countElement = document.querySelector('[data-testid="playlist-track-count"], .main-entityHeader-detailsText');
+    const countMatch = countElement && countElement.textContent.match(/(\\d+)\\s+(song|track)/i);
+    if (countMatch) {
+        data.expectedCount = parseInt(countMatch[1], 10);
+    }
+
+    // Get playlist name with minimum selectors
+    try {
+        // HTMLCollection lookup first; the test id only if the page has no h1
+        const titleElement = document.getElementsByTagName('h1')[0] ||
+            document.querySelector('[data-testid="entityTitle"]');
+        if (titleElement) {
+            data.name = titleElement.textContent.trim();
+        }
+    } catch (e) {
+        data.errors.push('title: ' + e);
+    }
+
+    // Find the main container with minimum queries
+    let trackElements = [];
+    let rowSelector = 'div[data-testid="tracklist-row"], div[role="row"]';
+    // One compound query instead of three separate container lookups
+    const container = document.querySelector(CONTAINER_SELECTOR);
+    // Scope for every later query; resolved once and reused. Without a container,
+    // search the main content area rather than the whole document
+    const root = container || document.getElementById('main') ||
+        document.querySelector('main') || document.body;
+
+    if (container) {
+        // Try multiple selectors but with minimal DOM traversal
+        for (let i = 0; i < ROW_SELECTORS.length; i++) {
+            const elements = container.querySelectorAll(ROW_SELECTORS[i]);
+            if (elements.length > 0) {
+                trackElements = elements;
+                rowSelector = ROW_SELECTORS[i];
+                break;
+            }
+        }
+    } else {
+        // Fallback: look for any track-like elements
+        trackElements = root.querySelectorAll(rowSelector);
+    }
+
+    // Resolve names and artists right-to-left: one query for every title and
+    // artist link, grouped by row, instead of per-row selector lookups
+    const rowInfo = new Map();
+    const links = root.querySelectorAll(LINK_SELECTOR);
+    for (let i = 0, len = links.length; i < len; i++) {
+        const link = links[i];
+        const row = link.closest(rowSelector);
+        if (!row) continue;
+        let info = rowInfo.get(row);
+        if (!info) {
+            info = {name: '', artists: []};
+            rowInfo.set(row, info);
+        }
+        if (link.getAttribute('data-testid') === 'internal-track-link') {
+            if (!info.name) info.name = link.textContent;
+        } else {
+            info.artists.push(link.textContent);
+        }
+    }
+
+    // Process track elements with minimal DOM queries; indexed loops over the
+    // NodeLists, with no intermediate arrays or per-row closures
+    for (let i = 0, len = trackElements.length; i < len; i++) {
+        const track = trackElements[i];
+        try {
+            // Read the row's name and artists from the precomputed map
+            const info = rowInfo.get(track);
+            const trackName = info ? info.name : '';
+
+            // Skip if no track name (likely a header)
+            if (!trackName || trackName === 'Title' || trackName === '#') {
+                continue;
+            }
+
+            const artists = info.artists.length ? info.artists : ['Unknown Artist'];
+
+            // Virtualized rows carry their absolute index; keep it for ordering
+            const indexed = track.closest('[aria-rowindex]');
+            const rowIndex = indexed ? parseInt(indexed.getAttribute('aria-rowindex'), 10) : NaN;
+
+            // Add track with minimal data
+            data.tracks.push({
+                name: trackName,
+                artists: artists,
+                position: i + 1,
+                rowIndex: isNaN(rowIndex) ? null : rowIndex
+            });
+        } catch (e) {
+            // Skip malformed rows silently; logging here fires once per row
+        }
+    }
+
+    return data;
+}
+
+const first = getPlaylistData();
+const collected = new Map();
+window.__tracks = collected;
+window.__tracksSettled = false;
+window.__playlistMeta = {
+    name: first.name, url: first.url, platform: first.platform, expectedCount: first.expectedCount,
+    errors: first.errors
+};
+
+// Rows are keyed by aria-rowindex so a row seen on several scroll steps is kept once
+const collect = () => {
+    let added = 0;
+    getPlaylistData().tracks.forEach(t => {
+        const key = t.rowIndex !== null ? t.rowIndex : t.name + '|' + t.artists.join(',');
+        if (!collected.has(key)) {
+            collected.set(key, t);
+            added++;
+        }
+    });
+    return added;
+};
+collect();
+
+// Mutations only mark the list dirty; rows are read at most once per frame
+let dirty = false;
+let lastAdded = performance.now();
+const target = document.querySelector(CONTAINER_SELECTOR) || document.body;
+const observer = new MutationObserver(() => { dirty = true; });
+observer.observe(target, {childList: true, subtree: true});
+
+// Scroll the nearest scrollable ancestor of the list one screen per frame
+let scroller = target;
+while (scroller && scroller.scrollHeight <= scroller.clientHeight) {
+    scroller = scroller.parentElement;
+}
+scroller = scroller || document.scrollingElement;
+
+const step = () => {
+    if (dirty) {
+        dirty = false;
+        if (collect() > 0) lastAdded = performance.now();
+    }
+    // Settled once no new rows have appeared for 500ms
+    if (performance.now() - lastAdded >= 500) {
+        observer.disconnect();
+        collect();
+        window.__tracksSettled = true;
+        return;
+    }
+    scroller.scrollBy(0, scroller.clientHeight);
+    requestAnimationFrame(step);
+};
+requestAnimationFrame(step);
+"""
+
+# Reads what _SPOTIFY_EXTRACT_JS collected, in playlist order
+_SPOTIFY_COLLECTED_JS = """
+if (!window.__tracks) return null;
+const tracks = Array.from(window.__tracks.values());
+// Indexed rows in list order; unindexed rows keep the order they were seen in
+tracks.sort((a, b) => (a.rowIndex === null ? Infinity : a.rowIndex) - (b.rowIndex === null ? Infinity : b.rowIndex));
+const data = Object.assign({}, window.__playlistMeta);
+data.tracks = tracks.map((t, i) => ({name: t.name, artists: t.artists, position: i + 1}));
+return data;
+"""
+
+# Apple Music extractor: one DOM walk collects the title and tracks, memoized on the page.
+# Registered on every new document at browser init so the scrape only sends a one-line
+# call; sent in full when a page is missing it
+_APPLE_EXTRACT_TRACKS_JS = """
+window.__extractTracks = function() {
+    // Repeat calls on the same page reuse the first result
+    if (window.__scraped) return window.__scraped;
+
+    const titleSelector = 'h1, h2, [class*="title"]:not([class*="subtitle"])';
+    const trackSelector = '[class*="track"], [class*="song"], [role="row"], [class*="list-item"]';
+    const nameCellSelector = '[class*="song-name"], [class*="track-name"]';
+    const artistCellSelector = '[class*="artist"], [class*="by-line"]';
+
+    let title = null;
+    const tracks = [];
+
+    // Single pass over title and track candidates, in document order
+    for (const el of document.querySelectorAll(titleSelector + ', ' + trackSelector)) {
+        if (title === null && el.matches(titleSelector)) {
+            title = el.textContent.trim();
+        }
+        if (!el.matches(trackSelector)) continue;
+
+        try {
+            // Simple check if this looks like a track element
+            const text = el.textContent.trim();
+            if (!text || text.length < 3) continue;
+
+            // Skip headers
+            if (text.includes("Track") && text.includes("Time") && text.includes("Artist")) continue;
+            if (text.includes("TITLE") && text.includes("ARTIST") && text.includes("ALBUM")) continue;
+
+            // Prefer the row's own title/artist cells; split the row text only without them
+            const nameCell = el.querySelector(nameCellSelector);
+            const artistCell = el.querySelector(artistCellSelector);
+            const segments = nameCell && artistCell
+                ? [nameCell.textContent.trim(), artistCell.textContent.trim()]
+                : text.split(/\\n|\\t/).map(s => s.trim()).filter(s => s.length > 1);
+
+            if (segments.length >= 2) {
+                const trackName = segments[0] || "Unknown Track";
+                const artistName = segments[1] || "Unknown Artist";
+
+                // Add to tracks if it seems valid
+                if (trackName.length > 1 && artistName.length > 1) {
+                    tracks.push({
+                        name: trackName,
+                        artists: [artistName],
+                        position: tracks.length + 1
+                    });
+                }
+            }
+        } catch(e) {
+            // Ignore errors in track parsing
+        }
+    }
+
+    window.__scraped = {title: title || "Apple Music Playlist", tracks: tracks};
+    return window.__scraped;
+};
+"""
+
+# Registered at document start: polling intervals never start on Apple Music pages, so
+# there is nothing left to clear once the page has loaded. Scoped to the Apple host,
+# since the Spotify player relies on its intervals
+_QUIET_TIMERS_JS = """
+if (location.hostname === 'music.apple.com') {
+    window.setInterval = function() { return 0; };
+}
+"""
+
+# Apple Music page quieting, registered per tab so it runs on every navigation without an
+# extra round-trip: once the server-rendered DOM is parsed, stop loading, freeze animations
+# and swallow input events. Scoped to the Apple host so other pages load normally
+_APPLE_QUIET_PAGE_JS = """
+if (location.hostname === 'music.apple.com') {
+    document.addEventListener('DOMContentLoaded', function() {
+        window.stop();
+        document.head.insertAdjacentHTML('beforeend',
+            '<style>* { animation: none !important; transition: none !important; }</style>'
+        );
+        const swallow = function(e) {
+            e.stopPropagation();
+            e.stopImmediatePropagation();
+        };
+        ['click', 'keydown', 'keyup', 'keypress', 'mouseover', 'mousemove', 'mousedown', 'mouseup', 'resize', 'scroll']
+            .forEach(function(type) { window.addEventListener(type, swallow, true); });
+    }, { once: true });
+}
+"""
+
+# Process-wide cap on WebDriver calls in flight, whichever scraper they come from
+_DRIVER_CALL_SLOTS = asyncio.BoundedSemaphore(int(os.getenv("SCRAPER_MAX_DRIVER_CALLS", "4")))
+
+# One HTTP session for the browser-free fetch paths, so repeat requests reuse
+# pooled keep-alive connections instead of a fresh TCP+TLS handshake each time
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+_HTTP_SESSION_LOCK = asyncio.Lock()
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _HTTP_SESSION
+    async with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+            _HTTP_SESSION = aiohttp.ClientSession(
+                # DNS answers are cached for 5 minutes; per-host cap keeps one site from starving the pool
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers=_HTTP_HEADERS,
+            )
+        return _HTTP_SESSION
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session; called on app shutdown."""
+    global _HTTP_SESSION
+    async with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is not None:
+            await _HTTP_SESSION.close()
+            _HTTP_SESSION = None
+
+# Paces the HTTP fast paths off each host's Retry-After/X-RateLimit-* headers, so
+# a throttled host gets waited on instead of being counted as a failed fetch
+_HOST_LIMITER = HostRateLimiter()
+_HTTP_MAX_ATTEMPTS = 3
+
+async def _http_get(url: str, reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = None) -> Tuple[int, Any]:
+    """
+    GET a page through the shared session, backing off on 429 and 5xx.
+    
+    Returns (status, body). The body is the decoded text, or whatever reader
+    returns when one is given to consume a 200 response itself; it is None when
+    the request did not succeed.
+    """
+    host = urlparse(url).netloc
+    session = await get_http_session()
+    for attempt in range(_HTTP_MAX_ATTEMPTS):
+        await _HOST_LIMITER.wait(host)
+        async with session.get(url) as response:
+            status = response.status
+            throttled = _HOST_LIMITER.update(host, status, response.headers)
+            if status == 200:
+                return status, await (reader(response) if reader else response.text())
+        if attempt == _HTTP_MAX_ATTEMPTS - 1:
+            break
+        if status == 429:
+            logger.info(f"[WARN] {host} rate limited us, retrying after {throttled:.1f}s")
+        elif status >= 500:
+            delay = _HOST_LIMITER.backoff_delay(attempt)
+            logger.info(f"[WARN] {host} returned {status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        else:
+            break
+    return status, None
+
+# Apple Music pages run to megabytes; they are streamed in chunks of this size
+_STREAM_CHUNK = 64 * 1024
+
+async def _read_apple_music_scripts(response: aiohttp.ClientResponse) -> Tuple[Optional[str], List[str]]:
+    """
+    Stream an Apple Music page and pull out only the script payloads we parse.
+    
+    Returns (serialized-server-data text, JSON-LD blocks). Reading stops at the
+    server-data script, so the rest of the page is never downloaded or parsed.
+    The part read so far is still built into a tree; only the script contents
+    are cleared once read.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="script", encoding=response.charset or "utf-8")
+    ld_blocks = []
+    async for chunk in response.content.iter_chunked(_STREAM_CHUNK):
+        parser.feed(chunk)
+        for _, script in parser.read_events():
+            if script.get("id") == "serialized-server-data":
+                return script.text, ld_blocks
+            if script.get("type") == "application/ld+json" and script.text:
+                ld_blocks.append(script.text)
+            script.clear()
+    return None, ld_blocks
 
 class BrowserInitializationError(Exception):
     """Raised when browser initialization fails after all retries."""
@@ -52,6 +742,9 @@ def normalize_text(text: str) -> str:
 class PlaylistScraper:
     """Scraper for retrieving playlist data from various music platforms."""
     
+    # Number of scrapers in this process currently holding an initialized browser
+    _live_browsers = 0
+    
     def __init__(self):
         self.browser = None
         self.wait = None
@@ -61,6 +754,15 @@ class PlaylistScraper:
             'last_action_time': datetime.now().isoformat()
         }
         self._last_action_time = datetime.now()
+        self._scrape_count = 0
+        self._blocked_urls = None  # blocklist currently applied to this browser
+        self._child_procs = []  # chromedriver and browser processes spawned by this scraper
+        self._profile_dir = ""  # user data directory of the running browser, removed on cleanup
+        # host:port of an externally managed Chrome to attach to instead of launching one
+        self._debugger_address = os.environ.get("CHROME_DEBUGGER_ADDRESS", "")
+        self._attached = bool(self._debugger_address)
+        # WebDriver calls are blocking; run them on one dedicated thread per browser
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playlist-scraper")
         logger.debug("Initializing PlaylistScraper")
 
     async def initialize_browser(self):
@@ -73,187 +775,62 @@ class PlaylistScraper:
             in_container = os.environ.get("RENDER", "") != "" or os.path.exists("/.dockerenv")
             logger.info(f"Environment detection: container={in_container}")
             
-            # Print the Chrome version for diagnostics
-            import subprocess
-            try:
-                chrome_version = subprocess.check_output(['google-chrome', '--version']).decode('utf-8').strip()
-                logger.info(f"Chrome version: {chrome_version}")
-            except Exception as e:
-                logger.warning(f"Failed to get Chrome version: {str(e)}")
-            
             # CRITICAL: Create a unique temporary user data directory for each Chrome instance
             import tempfile
             import uuid
-            import psutil
-            import signal
             import time
             
-            # First, attempt to kill any existing Chrome processes - critical in container environments
-            try:
-                logger.info("Attempting to kill any existing Chrome processes")
-                chrome_processes_killed = 0
-                for proc in psutil.process_iter(['pid', 'name']):
-                    try:
-                        # Look for any chrome-related processes
-                        proc_name = proc.info['name'].lower()
-                        if 'chrome' in proc_name or 'chromium' in proc_name:
-                            try:
-                                # Force kill the process
-                                os.kill(proc.info['pid'], signal.SIGKILL)
-                                chrome_processes_killed += 1
-                                logger.info(f"Killed Chrome process with PID {proc.info['pid']}")
-                            except Exception as kill_err:
-                                logger.warning(f"Failed to kill Chrome process {proc.info['pid']}: {str(kill_err)}")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        pass
-                logger.info(f"Killed {chrome_processes_killed} Chrome processes")
-                
-                # NEW: Also forcibly kill chromedriver processes
-                chromedriver_killed = 0
-                for proc in psutil.process_iter(['pid', 'name']):
+            if self._attached:
+                # Attach to the long-lived browser over CDP; it is launched and cleaned up outside this process
+                chrome_options = webdriver.ChromeOptions()
+                chrome_options.add_experimental_option("debuggerAddress", self._debugger_address)
+                temp_dir = ""
+                logger.info(f"Attaching to existing Chrome at {self._debugger_address}")
+            else:
+                # Clear lock files and profile directories left behind by crashed browsers.
+                # Skipped while other scrapers in this process hold a live browser, since they may still be in use.
+                if PlaylistScraper._live_browsers == 0:
                     try:
-                        proc_name = proc.info['name'].lower()
-                        if 'chromedriver' in proc_name:
+                        # Leftover X and Chrome singleton locks; Chrome's are sometimes directories
+                        for lock_path in glob.glob("/tmp/.X*-lock") + glob.glob("/tmp/.com.google.Chrome*"):
                             try:
-                                os.kill(proc.info['pid'], signal.SIGKILL)
-                                chromedriver_killed += 1
-                                logger.info(f"Killed ChromeDriver process with PID {proc.info['pid']}")
-                            except Exception as kill_err:
-                                logger.warning(f"Failed to kill ChromeDriver process {proc.info['pid']}: {str(kill_err)}")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        pass
-                logger.info(f"Killed {chromedriver_killed} ChromeDriver processes")
-                
-                # NEW: Clean leftover locks with system commands
-                os.system("rm -f /tmp/.X*-lock")
-                os.system("rm -f /tmp/.com.google.Chrome*")
+                                if os.path.isdir(lock_path):
+                                    shutil.rmtree(lock_path, ignore_errors=True)
+                                else:
+                                    os.unlink(lock_path)
+                            except OSError:
+                                pass
                 
-                # NEW: Force remove all Chrome user data directories 
-                import glob
-                import shutil
-                for chrome_dir in glob.glob("/tmp/chrome_data_*"):
-                    try:
-                        # First try OS-level deletion for force
-                        os.system(f"rm -rf {chrome_dir}")
-                        
-                        # Double-check with Python's shutil
-                        if os.path.exists(chrome_dir):
+                        # Remove Chrome user data directories; a leaked one on /dev/shm holds RAM until reboot
+                        for chrome_dir in glob.glob("/tmp/chrome_data_*") + _stale_profile_dirs():
                             shutil.rmtree(chrome_dir, ignore_errors=True)
-                            
-                        logger.info(f"Forcibly removed Chrome directory: {chrome_dir}")
-                    except Exception as rm_err:
-                        logger.warning(f"Failed to remove directory {chrome_dir}: {str(rm_err)}")
-            except Exception as proc_err:
-                logger.warning(f"Error when cleaning up Chrome processes: {str(proc_err)}")
-            
-            # Add a random delay to allow system to clean up resources
-            delay = random.uniform(0.5, 1.5)
-            logger.info(f"Waiting {delay:.2f} seconds for system cleanup")
-            time.sleep(delay)
-            
-            # NEW: Create a truly unique user data directory using process ID and timestamp
-            pid = os.getpid()
-            timestamp = int(time.time())
-            random_id = uuid.uuid4().hex[:8]
-            temp_dir = f"/tmp/chrome_tmp_{pid}_{timestamp}_{random_id}"
-            
-            # Ensure the directory doesn't exist
-            if os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                except Exception as e:
-                    pass
-                
-            # Create fresh directory with restrictive permissions
-            try:
-                os.makedirs(temp_dir, mode=0o700, exist_ok=False)
-                logger.info(f"Created fresh Chrome user data directory: {temp_dir}")
-            except Exception as e:
-                logger.warning(f"Failed to create directory {temp_dir}: {str(e)}")
-                # Fall back to RAM-based storage if we can't create the directory
-                temp_dir = "/dev/shm/chrome_tmp_" + random_id
-                try:
-                    os.makedirs(temp_dir, mode=0o700, exist_ok=False)
-                    logger.info(f"Created RAM-based Chrome user data directory: {temp_dir}")
-                except Exception as e2:
-                    logger.warning(f"Failed to create RAM directory: {str(e2)}")
-                    # Ultimate fallback - let Chrome decide
-                    temp_dir = ""
-            
-            # Configure Chrome options with EXTREME resource limitations for containers
-            chrome_options = webdriver.ChromeOptions()
-            
-            # CRITICAL: Set the user data directory to our fresh directory, or bypass it completely
-            if temp_dir:
-                chrome_options.add_argument(f'--user-data-dir={temp_dir}')
-                logger.info(f"Using custom user data directory: {temp_dir}")
-            else:
-                # Use a null profile directory to avoid any disk data
-                chrome_options.add_argument('--incognito')
-                chrome_options.add_argument('--profile-directory=Default')
-                chrome_options.add_argument('--disable-infobars')
-                logger.info("Using incognito mode with no user data directory")
-            
-            # Add flags to prevent lock file issues
-            chrome_options.add_argument('--no-first-run')
-            chrome_options.add_argument('--no-default-browser-check')
-            chrome_options.add_argument('--password-store=basic')
-            
-            # Also disable any disk cache to prevent disk usage growth
-            chrome_options.add_argument('--disk-cache-size=1')
-            chrome_options.add_argument('--media-cache-size=1')
-            chrome_options.add_argument('--disable-application-cache')
-            
-            # Always use headless mode in production environments
-            chrome_options.add_argument('--headless=new')
-            logger.info("Running Chrome in headless mode")
-            
-            # CRITICAL: Absolute minimum memory usage configuration
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            
-            # EXPERIMENTAL: Force reduced memory limits to survive in container
-            chrome_options.add_argument('--disable-features=site-per-process')  # Disable site isolation
-            chrome_options.add_argument('--renderer-process-limit=1')  # Only allow one renderer process
-            chrome_options.add_argument('--disable-hang-monitor')  # Disable the hang monitor
-            chrome_options.add_argument('--process-per-site')  # Use process-per-site instead of process-per-tab
-            chrome_options.add_argument('--single-process')  # Most aggressive - force single process mode
-            
-            # Reduce JavaScript memory footprint drastically
-            chrome_options.add_argument('--js-flags=--max-old-space-size=64')  # Limit JS heap to 64MB
-            
-            # Disable everything non-essential
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-component-extensions-with-background-pages')
-            chrome_options.add_argument('--disable-default-apps')
-            chrome_options.add_argument('--disable-background-networking')
-            chrome_options.add_argument('--disable-sync')
-            chrome_options.add_argument('--disable-translate')
-            chrome_options.add_argument('--hide-scrollbars')
-            chrome_options.add_argument('--mute-audio')
-            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
-            
-            # Disable storage APIs to save memory
-            chrome_options.add_argument('--disable-local-storage')
-            chrome_options.add_argument('--disable-session-storage')
-            chrome_options.add_argument('--disable-notifications')
-            
-            # Prevent crash reporting and diagnostics
-            chrome_options.add_argument('--disable-crash-reporter')
-            chrome_options.add_argument('--disable-breakpad')  # Disable crashdump creation
-            chrome_options.add_argument('--disable-logging')
-            chrome_options.add_argument('--log-level=3')  # Minimal logging
-            
-            # Configure prefs for minimal memory use
-            chrome_options.add_experimental_option('prefs', {
-                'profile.default_content_setting_values.cookies': 2,  # Block cookies
-                'profile.default_content_setting_values.images': 2,  # Block images
-                'profile.default_content_setting_values.popups': 2,  # Block popups
-                'profile.managed_default_content_settings.javascript': 1,  # Allow JS (needed)
-                'profile.default_content_setting_values.notifications': 2,  # Block notifications
-                'profile.managed_default_content_settings.plugins': 2,  # Block plugins
-            })
+                            logger.info(f"Removed Chrome directory: {chrome_dir}")
+                    except Exception as proc_err:
+                        logger.warning(f"Error when cleaning up leftover Chrome files: {str(proc_err)}")
+                else:
+                    logger.info(f"Skipping leftover Chrome file cleanup: {PlaylistScraper._live_browsers} browser(s) in use")
+            
+                # Add a random delay to allow system to clean up resources
+                delay = random.uniform(0.5, 1.5)
+                logger.info(f"Waiting {delay:.2f} seconds for system cleanup")
+                await asyncio.sleep(delay)
+            
+                # NEW: Create a truly unique user data directory using process ID and timestamp
+                pid = os.getpid()
+                timestamp = int(time.time())
+                random_id = uuid.uuid4().hex[:8]
+                temp_dir = _make_profile_dir(f"chrome_tmp_{pid}_{timestamp}_{random_id}")
+            
+                # Configure Chrome options with EXTREME resource limitations for containers
+                if temp_dir:
+                    chrome_options = _chrome_options(temp_dir)
+                    logger.info(f"Using custom user data directory: {temp_dir}")
+                else:
+                    # Use a null profile directory to avoid any disk data
+                    chrome_options = _chrome_options(None, _NO_PROFILE_CHROME_ARGS + _BASE_CHROME_ARGS)
+                    logger.info("Using incognito mode with no user data directory")
+                logger.info(f"Running chrome-headless-shell from {_HEADLESS_SHELL}" if _HEADLESS_SHELL
+                            else "Running Chrome in headless mode")
             
             # New approach: progressive browser initialization with retries
             max_retries = 3
@@ -262,21 +839,25 @@ class PlaylistScraper:
                     logger.info(f"Browser initialization attempt {attempt}/{max_retries}")
                     
                     # Create WebDriver directly using Selenium Manager (built into Selenium 4)
-                    self.browser = webdriver.Chrome(options=chrome_options)
+                    # Launching Chrome blocks for seconds; keep it off the event loop
+                    self.browser = await self._run(lambda: webdriver.Chrome(options=chrome_options))
+                    self._record_child_procs()
                     logger.info("Successfully initialized Chrome browser with Selenium Manager")
                     
-                    # Set very aggressive timeouts for cloud environment
-                    self.browser.implicitly_wait(2)  # Very short implicit wait
-                    self.browser.set_page_load_timeout(20)  # Short page load timeout
-                    self.browser.set_script_timeout(10)  # Short script timeout
+                    await self._run(self._configure_browser)
                     
                     # Test browser with absolute minimal test
                     try:
                         # Navigate to a blank page - lowest possible resource usage
-                        self.browser.get('about:blank')
+                        await self._run(self.browser.get, 'about:blank')
                         
                         # If we get here, the browser is responsive
                         self._initialized = True
+                        PlaylistScraper._live_browsers += 1
+                        self._profile_dir = temp_dir
+                        
+                        # Scripts, blocklist and throttling are per target; set up the first tab
+                        await self._run(self._prepare_tab)
                         logger.info("Browser initialization confirmed working with minimal test")
                         return
                     except Exception as test_error:
@@ -284,76 +865,36 @@ class PlaylistScraper:
                         # Clean up and try again with even more minimal options
                         if hasattr(self, 'browser') and self.browser:
                             try:
-                                self.browser.quit()
+                                await self._run(self.browser.quit)
                             except:
                                 pass
+                            self._kill_child_procs()
                             
                             # Also try to manually clean up the Chrome user data directory
                             try:
-                                import shutil
-                                if os.path.exists(temp_dir):
-                                    # Try force removal with system command first
-                                    os.system(f"rm -rf {temp_dir}")
-                                    logger.info(f"Force removed Chrome user data directory: {temp_dir}")
-                                    
-                                    # Then try the normal way as backup
-                                    if os.path.exists(temp_dir):
-                                        shutil.rmtree(temp_dir, ignore_errors=True)
-                                        logger.info(f"Cleaned up Chrome user data directory: {temp_dir}")
+                                if temp_dir:
+                                    shutil.rmtree(temp_dir, ignore_errors=True)
+                                    logger.info(f"Cleaned up Chrome user data directory: {temp_dir}")
                             except Exception as cleanup_error:
                                 logger.warning(f"Failed to clean up Chrome user data directory: {str(cleanup_error)}")
                         
-                        if attempt < max_retries:
+                        if attempt < max_retries and not self._attached:
                             # Wait longer between retries
                             retry_delay = random.uniform(1.0, 3.0) * attempt  # Increase delay with each retry
                             logger.info(f"Waiting {retry_delay:.2f} seconds before retry {attempt+1}/{max_retries}")
-                            time.sleep(retry_delay)
-                            
-                            # Create a completely new temp directory for this attempt
-                            pid = os.getpid()
-                            timestamp = int(time.time())
-                            random_id = uuid.uuid4().hex[:8]
-                            new_temp_dir = f"/tmp/chrome_retry_{attempt}_{pid}_{timestamp}_{random_id}"
-                            
-                            try:
-                                # Ensure it's empty
-                                if os.path.exists(new_temp_dir):
-                                    shutil.rmtree(new_temp_dir, ignore_errors=True)
-                                    
-                                # Create with restrictive permissions
-                                os.makedirs(new_temp_dir, mode=0o700, exist_ok=False)
-                                logger.info(f"Created fresh retry directory: {new_temp_dir}")
-                            except Exception as e:
-                                logger.warning(f"Failed to create retry directory {new_temp_dir}: {str(e)}")
-                                # Use RAM-based storage as fallback
-                                new_temp_dir = f"/dev/shm/chrome_retry_{attempt}_{random_id}"
-                                try:
-                                    os.makedirs(new_temp_dir, mode=0o700, exist_ok=False)
-                                    logger.info(f"Created RAM-based retry directory: {new_temp_dir}")
-                                except Exception as e2:
-                                    logger.warning(f"Failed to create RAM retry directory: {str(e2)}")
-                                    # Final fallback - let Chrome decide
-                                    new_temp_dir = ""
-                            
-                            # Create a new ChromeOptions object for each retry
-                            chrome_options = webdriver.ChromeOptions()
+                            await asyncio.sleep(retry_delay)
                             
                             # Make options even more minimal with each retry
                             if attempt == 1:
-                                # On second attempt, use minimal options
-                                chrome_options.add_argument('--headless=new')
-                                chrome_options.add_argument('--no-sandbox')
-                                chrome_options.add_argument('--disable-dev-shm-usage')
-                                chrome_options.add_argument('--disable-gpu')
-                                chrome_options.add_argument('--incognito')
-                                chrome_options.add_argument('--disable-extensions')
-                                chrome_options.add_argument('--disable-logging')
-                                chrome_options.add_argument('--log-level=3')
-                                chrome_options.add_argument('--no-first-run')
-                                chrome_options.add_argument('--no-default-browser-check')
+                                # Create a completely new temp directory for this attempt
+                                pid = os.getpid()
+                                timestamp = int(time.time())
+                                random_id = uuid.uuid4().hex[:8]
+                                new_temp_dir = _make_profile_dir(f"chrome_retry_{attempt}_{pid}_{timestamp}_{random_id}")
                                 
+                                # On second attempt, use minimal options
+                                chrome_options = _chrome_options(new_temp_dir, _RETRY_CHROME_ARGS, prefs=None)
                                 if new_temp_dir:
-                                    chrome_options.add_argument(f'--user-data-dir={new_temp_dir}')
                                     logger.info(f"Using custom retry directory: {new_temp_dir}")
                                 else:
                                     logger.info("Using no user data directory for retry")
@@ -361,19 +902,12 @@ class PlaylistScraper:
                                 logger.info("Using simpler browser configuration for retry")
                             elif attempt == 2:
                                 # On final attempt, try remote debugging mode - completely different approach
-                                chrome_options = webdriver.ChromeOptions()
+                                new_temp_dir = ""
+                                chrome_options = _chrome_options(None, _LAST_RESORT_CHROME_ARGS, prefs=None)
                                 debug_port = random.randint(9222, 9999)
-                                chrome_options.add_argument('--headless=new')
-                                chrome_options.add_argument('--no-sandbox')
-                                chrome_options.add_argument('--disable-dev-shm-usage')
-                                chrome_options.add_argument('--disable-gpu')
-                                chrome_options.add_argument('--incognito')
                                 chrome_options.add_argument(f'--remote-debugging-port={debug_port}')
-                                chrome_options.add_argument('--disable-extensions')
-                                chrome_options.add_argument('--disable-site-isolation-trials')
                                 
-                                # Bypass user data directory completely
-                                chrome_options.add_argument('--guest')  # Use guest mode
+                                # Guest mode bypasses the user data directory completely
                                 logger.info(f"Using remote debugging on port {debug_port} with guest mode for final attempt")
                             
                             # Update the temp_dir variable for cleanup
@@ -382,9 +916,10 @@ class PlaylistScraper:
                     logger.error(f"Browser creation error on attempt {attempt}: {str(e)}")
                     if hasattr(self, 'browser') and self.browser:
                         try:
-                            self.browser.quit()
+                            await self._run(self.browser.quit)
                         except:
                             pass
+                    self._kill_child_procs()
                     
                     if attempt == max_retries:
                         # All attempts failed
@@ -402,26 +937,17 @@ class PlaylistScraper:
         try:
             if hasattr(self, 'browser') and self.browser:
                 logger.info("Cleaning up browser resources...")
-                try:
-                    # Close all windows
-                    for handle in self.browser.window_handles:
-                        self.browser.switch_to.window(handle)
-                        self.browser.close()
-                except Exception as e:
-                    logger.warning(f"Error closing windows: {str(e)}")
-
-                try:
-                    # Quit browser
-                    self.browser.quit()
-                    logger.info("Browser quit successfully")
-                except Exception as e:
-                    logger.warning(f"Error quitting browser: {str(e)}")
+                await self._run(self._quit_browser)
+                # Anything quit() left running
+                self._kill_child_procs()
+                
+                # The profile may live on tmpfs, where a leaked directory holds RAM
+                if self._profile_dir:
+                    shutil.rmtree(self._profile_dir, ignore_errors=True)
+                    self._profile_dir = ""
                 
                 # Also try to find and clean up any Chrome user data directories we created
                 try:
-                    import shutil
-                    import glob
-                    
                     # Look for temp directories that match our pattern
                     temp_dirs = glob.glob("/tmp/chrome_data_*")
                     for dir_path in temp_dirs:
@@ -434,6 +960,9 @@ class PlaylistScraper:
                 except Exception as e:
                     logger.warning(f"Error during Chrome data directory cleanup: {str(e)}")
 
+                if self._initialized:
+                    PlaylistScraper._live_browsers -= 1
+                self._blocked_urls = None
                 self.browser = None
                 self.wait = None
                 self._initialized = False
@@ -442,253 +971,467 @@ class PlaylistScraper:
             logger.error(f"Error during cleanup: {str(e)}")
             # Don't raise the exception as this is cleanup code
 
-    async def get_apple_music_playlist_data(self, url: str) -> Dict:
+    def _configure_browser(self) -> None:
+        """Blocking half of initialize_browser: pick our tab and set the driver timeouts."""
+        # A shared browser is used by other scrapers too; work in a tab of our own
+        if self._attached:
+            self.browser.switch_to.new_window('tab')
+        
+        # Set very aggressive timeouts for cloud environment
+        self.browser.implicitly_wait(0)  # No implicit wait; explicit waits only
+        self.browser.set_page_load_timeout(20)  # Short page load timeout
+        self.browser.set_script_timeout(10)  # Short script timeout
+
+    def _quit_browser(self) -> None:
+        """Blocking half of cleanup: close our windows and quit the driver."""
+        try:
+            # Close all windows, or only our own tab in a shared browser
+            if self._attached:
+                self.browser.close()
+            else:
+                for handle in self.browser.window_handles:
+                    self.browser.switch_to.window(handle)
+                    self.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing windows: {str(e)}")
+
+        try:
+            # Quit browser
+            self.browser.quit()
+            logger.info("Browser quit successfully")
+        except Exception as e:
+            logger.warning(f"Error quitting browser: {str(e)}")
+
+    def _record_child_procs(self) -> None:
+        """Remember the chromedriver and browser processes this scraper spawned."""
+        self._child_procs = []
+        try:
+            driver = psutil.Process(self.browser.service.process.pid)
+            self._child_procs = [driver] + driver.children(recursive=True)
+        except (AttributeError, psutil.Error) as e:
+            logger.debug(f"Could not record browser processes: {str(e)}")
+
+    def _kill_child_procs(self) -> None:
+        """SIGKILL the processes recorded at launch that are still running; never touches other browsers."""
+        for proc in self._child_procs:
+            try:
+                # psutil checks the process start time, so a recycled PID is never killed
+                proc.send_signal(signal.SIGKILL)
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.warning(f"Failed to kill browser process {proc.pid}: {str(e)}")
+        self._child_procs = []
+
+    def _prepare_tab(self, blocked_urls: List[str] = _SPOTIFY_BLOCKED_URLS) -> None:
+        """Apply the per-target CDP setup (document-start scripts, blocklist, throttling) to the current tab."""
+        # Pre-register the Apple Music extractor and page patches on every page this tab loads
+        try:
+            self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _APPLE_EXTRACT_TRACKS_JS})
+            self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _QUIET_TIMERS_JS})
+            self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _APPLE_QUIET_PAGE_JS})
+        except Exception as e:
+            logger.warning(f"Failed to register document-start scripts: {str(e)}")
+        
+        # Apply the common-case blocklist once; scrapes only resend it when switching platforms.
+        # The blocklist is enforced by the Network domain, so make sure it is enabled on this target
+        self._blocked_urls = None
+        try:
+            self.browser.execute_cdp_cmd('Network.enable', {})
+            self._set_blocked_urls(blocked_urls)
+        except Exception as e:
+            logger.warning(f"Failed to set blocked URLs: {str(e)}")
+        
+        # Pin the browser to wire speed and full CPU rather than trusting profile defaults
+        try:
+            self.browser.execute_cdp_cmd('Network.emulateNetworkConditions', {
+                'offline': False, 'latency': 0, 'downloadThroughput': -1, 'uploadThroughput': -1
+            })
+            self.browser.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': 1})
+        except Exception as e:
+            logger.warning(f"Failed to disable throttling: {str(e)}")
+        # Experimental in CDP; older Chrome builds reject it
+        try:
+            self.browser.execute_cdp_cmd('Page.setAdBlockingEnabled', {'enabled': True})
+        except Exception as e:
+            logger.debug(f"Ad blocking not available: {str(e)}")
+
+    @asynccontextmanager
+    async def _tab(self, blocked_urls: List[str] = _SPOTIFY_BLOCKED_URLS):
         """
-        Extract playlist data from Apple Music with ultra-lightweight approach.
+        Run a scrape in a fresh CDP target that is closed afterwards, keeping the browser process alive.
         
-        Optimized for resource-constrained environments to prevent browser crashes.
+        The target lives in its own incognito browser context, so each scrape starts with
+        no cookies, storage, IndexedDB or service workers, and disposing the context
+        throws all of it away again in one call.
         """
-        self._log_state("start_apple_music_extraction")
+        target_id, context_id, home = await self._run(self._open_tab, blocked_urls)
+        try:
+            yield target_id
+        finally:
+            await self._run(self._close_tab, context_id, home)
+
+    def _open_tab(self, blocked_urls: List[str]) -> Tuple[str, str, str]:
+        """Blocking half of _tab: create a blank target in a new context, switch to it, and set it up."""
+        home = self.browser.current_window_handle
+        # disposeOnDetach cleans the context up even if this session dies mid-scrape
+        context_id = self.browser.execute_cdp_cmd('Target.createBrowserContext', {'disposeOnDetach': True})['browserContextId']
+        try:
+            target_id = self.browser.execute_cdp_cmd('Target.createTarget', {
+                'url': 'about:blank', 'browserContextId': context_id
+            })['targetId']
+            # ChromeDriver window handles are CDP target ids
+            self.browser.switch_to.window(target_id)
+            self._prepare_tab(blocked_urls)
+        except Exception:
+            # _tab never gets to close it, so don't leave the context behind
+            self._close_tab(context_id, home)
+            raise
+        return target_id, context_id, home
+
+    def _close_tab(self, context_id: str, home: str) -> None:
+        """Blocking half of _tab: dispose of the scrape's context and return to the home tab."""
+        # The blocklist we last sent belonged to the closed tab, not the home one
+        self._blocked_urls = None
+        try:
+            self.browser.switch_to.window(home)
+            # Closes the scrape's tab along with everything it stored
+            self.browser.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context_id})
+        except Exception as e:
+            logger.warning(f"Failed to close scrape tab: {str(e)}")
+
+    async def _reset_between_scrapes(self):
+        """Release renderer memory held by the last playlist page so the browser stays bounded."""
+        if not self.browser:
+            return
+        await self._run(self._release_page_state)
+
+    def _release_page_state(self) -> None:
+        """Blocking half of _reset_between_scrapes; runs on the browser thread."""
+        try:
+            # Keep a single tab open; an attached browser's other tabs belong to other scrapers
+            if not self._attached:
+                handles = self.browser.window_handles
+                for handle in handles[1:]:
+                    self.browser.switch_to.window(handle)
+                    self.browser.close()
+                self.browser.switch_to.window(handles[0])
+            
+            # Drop the previous page's DOM and JS heap
+            self.browser.get('about:blank')
+            self.browser.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+            
+            # Keep the warm session between scrapes, but wipe it periodically so cookies and cache don't bloat
+            self._scrape_count += 1
+            if self._scrape_count % _FULL_WIPE_EVERY == 0:
+                logger.info(f"Wiping browser cookies and cache after {self._scrape_count} scrapes")
+                self.browser.execute_cdp_cmd('Network.clearBrowserCache', {})
+                self.browser.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception as e:
+            logger.warning(f"Failed to reset browser between scrapes: {str(e)}")
+
+    def _set_blocked_urls(self, urls: List[str]) -> None:
+        """Apply a CDP URL blocklist, skipping the round-trip when this browser already has it."""
+        if self._blocked_urls is urls:
+            return
+        self.browser.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+        self._blocked_urls = urls
+
+    async def _run(self, fn, *args):
+        """Run a blocking WebDriver call on this scraper's browser thread, keeping the event loop free."""
+        # Each scraper has its own single-thread executor; the semaphore caps how many
+        # browsers are busy at once across the whole process
+        async with _DRIVER_CALL_SLOTS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def _fetch_apple_music_http(self, url: str) -> Optional[Dict]:
+        """
+        Fetch an Apple Music playlist without a browser.
         
+        Apple Music server-renders the full track list into a
+        <script id="serialized-server-data"> JSON payload, so a plain HTTP GET is
+        usually enough. Returns None when the page can't be fetched or parsed, so
+        the caller can fall back to the Selenium path.
+        """
         try:
-            # Clear cookies and storage for fresh start
-            self.browser.delete_all_cookies()
-            self.browser.execute_script("""
-                try {
-                    window.localStorage.clear();
-                    window.sessionStorage.clear();
-                    console.log('Storage cleared');
-                } catch(e) {
-                    console.log('Failed to clear storage:', e);
-                }
-            """)
+            status, scripts = await _http_get(url, _read_apple_music_scripts)
+            if status != 200:
+                logger.warning(f"Apple Music HTTP fetch returned status {status}")
+                return None
             
-            logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Starting ultra-lightweight Apple Music data extraction for URL: {url}")
+            playlist_data = self._parse_apple_music_server_data(*scripts)
+        except Exception as e:
+            logger.warning(f"Apple Music HTTP fetch failed, falling back to browser: {str(e)}")
+            return None
+        
+        if not playlist_data or not playlist_data["tracks"]:
+            logger.info("Apple Music page had no server-rendered tracks, falling back to browser")
+            return None
+        
+        playlist_data["url"] = url
+        logger.info(f"Extracted {len(playlist_data['tracks'])} tracks from Apple Music playlist over HTTP")
+        return playlist_data
+
+    def _parse_apple_music_server_data(self, server_data: Optional[str], ld_blocks: List[str]) -> Optional[Dict]:
+        """
+        Build playlist data from the JSON embedded in an Apple Music page.
+        
+        Reads the serialized-server-data payload, and falls back to the
+        schema.org MusicPlaylist JSON-LD when that payload has no tracks.
+        """
+        name = None
+        tracks = []
+        
+        try:
+            payload = orjson.loads(server_data) if server_data else []
+        except orjson.JSONDecodeError:
+            payload = []
+        # Older pages serialize a bare list, newer ones wrap it in {"data": [...]};
+        # anything else is a layout we don't know and yields no tracks
+        if isinstance(payload, dict):
+            payload = payload.get("data")
+        payload = _as_list(payload)
+        page = _as_dict(_as_dict(payload[0]).get("data")) if payload else {}
+        
+        for section in _as_list(page.get("sections")):
+            section = _as_dict(section)
+            item_kind = section.get("itemKind")
+            for item in _as_list(section.get("items")):
+                item = _as_dict(item)
+                if item_kind == "trackLockup" and isinstance(item.get("title"), str) and item["title"]:
+                    artists = [
+                        link["title"] for link in _as_list(item.get("subtitleLinks"))
+                        if isinstance(link, dict) and link.get("title")
+                    ]
+                    if not artists:
+                        artists = [item.get("artistName") or "Unknown Artist"]
+                    tracks.append({
+                        "name": item["title"],
+                        "artists": artists,
+                        "position": len(tracks) + 1
+                    })
+                elif item_kind == "containerDetailHeaderLockup" and name is None:
+                    name = item.get("title")
+        
+        if not tracks:
+            name, tracks = self._parse_apple_music_json_ld(ld_blocks)
+        if name is None and not tracks:
+            return None
+        
+        return {
+            "name": name or "Unknown Apple Music Playlist",
+            "platform": "apple-music",
+            "description": "",
+            "tracks": tracks,
+            "total_tracks": len(tracks),
+            "scrape_time": datetime.now().isoformat(),
+            "_extraction_method": "http"
+        }
+
+    def _parse_apple_music_json_ld(self, ld_blocks: List[str]) -> Tuple[Optional[str], List[Dict]]:
+        """Return (name, tracks) from a schema.org MusicPlaylist JSON-LD block, if the page has one."""
+        for block in ld_blocks:
+            try:
+                data = orjson.loads(block)
+            except orjson.JSONDecodeError:
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                if not isinstance(item, dict) or item.get("@type") != "MusicPlaylist":
+                    continue
+                entries = item.get("track", [])
+                # The track list may be a bare array or an ItemList of ListItems
+                if isinstance(entries, dict):
+                    entries = [
+                        e.get("item", e) if isinstance(e, dict) else e
+                        for e in _as_list(entries.get("itemListElement"))
+                    ]
+                tracks = []
+                for entry in _as_list(entries):
+                    if not isinstance(entry, dict) or not entry.get("name"):
+                        continue
+                    by_artist = entry.get("byArtist") or []
+                    if isinstance(by_artist, dict):
+                        by_artist = [by_artist]
+                    artists = [a["name"] for a in by_artist if isinstance(a, dict) and a.get("name")]
+                    tracks.append({
+                        "name": entry["name"],
+                        "artists": artists or ["Unknown Artist"],
+                        "position": len(tracks) + 1
+                    })
+                return item.get("name"), tracks
+        return None, []
+
+    async def _fetch_spotify_embed_http(self, url: str) -> Optional[Dict]:
+        """
+        Fetch a Spotify playlist from its embed page without a browser.
+        
+        open.spotify.com/embed/playlist/<id> is server-rendered and carries the
+        track list in its <script id="__NEXT_DATA__"> JSON. Returns None when the
+        page can't be fetched or parsed, so the caller can fall back to Selenium.
+        """
+        match = _SPOTIFY_PLAYLIST_ID_RE.search(url)
+        if not match:
+            return None
+        embed_url = f"https://open.spotify.com/embed/playlist/{match.group(1)}"
+        try:
+            status, page_html = await _http_get(embed_url)
+            if status != 200:
+                logger.warning(f"Spotify embed fetch returned status {status}")
+                return None
             
-            # CRITICAL: Block almost all resources to minimize memory usage
-            logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Setting up aggressive resource blocking")
-            self.browser.execute_cdp_cmd('Network.setBlockedURLs', {
-                'urls': [
-                    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.svg', 
-                    '*.woff', '*.woff2', '*.ttf', '*.otf',
-                    '*.css', # Block CSS to save memory (might affect page display)
-                    '*.js', # Block non-essential JavaScript
-                    'https://www.google-analytics.com/*',
-                    'https://analytics.apple.com/*',
-                    'https://metrics.apple.com/*',
-                    'https://*.doubleclick.net/*',
-                    'https://connect.facebook.net/*',
-                    'https://*.googlesyndication.com/*',
-                    'https://*.googletagmanager.com/*',
-                    'https://*.googleadservices.com/*',
-                    'https://*.hotjar.com/*',
-                    'https://*.intercom.io/*',
-                    'https://*.segment.io/*',
-                    'https://cdn.optimizely.com/*'
-                ]
+            playlist_data = self._parse_spotify_embed_data(page_html)
+        except Exception as e:
+            logger.warning(f"Spotify embed fetch failed, falling back to browser: {str(e)}")
+            return None
+        
+        if not playlist_data or not playlist_data["tracks"]:
+            logger.info("Spotify embed page had no tracks, falling back to browser")
+            return None
+        
+        playlist_data["url"] = url
+        logger.info(f"Extracted {len(playlist_data['tracks'])} tracks from Spotify embed over HTTP")
+        return playlist_data
+
+    def _parse_spotify_embed_data(self, page_html: str) -> Optional[Dict]:
+        """Build playlist data from the __NEXT_DATA__ JSON embedded in a Spotify embed page."""
+        doc = lxml_html.fromstring(page_html)
+        payload_text = doc.xpath('//script[@id="__NEXT_DATA__"]/text()')
+        if not payload_text:
+            return None
+        
+        try:
+            payload = orjson.loads(str(payload_text[0]))
+        except orjson.JSONDecodeError:
+            return None
+        entity = _as_dict(payload)
+        for key in ("props", "pageProps", "state", "data", "entity"):
+            entity = _as_dict(entity.get(key))
+        if not entity:
+            return None
+        
+        tracks = []
+        for item in _as_list(entity.get("trackList")):
+            if not isinstance(item, dict) or not isinstance(item.get("title"), str) or not item["title"]:
+                continue
+            # The subtitle is the comma-joined artist credit
+            subtitle = item.get("subtitle")
+            artists = [a.strip() for a in subtitle.split(",") if a.strip()] if isinstance(subtitle, str) else []
+            tracks.append({
+                "name": item["title"],
+                "artists": artists or ["Unknown Artist"],
+                "position": len(tracks) + 1
             })
+        
+        return {
+            "name": entity.get("name") or entity.get("title") or "Spotify Playlist",
+            "platform": "spotify",
+            "tracks": tracks,
+            "total_tracks": len(tracks),
+            "scrape_time": datetime.now().isoformat(),
+            "_extraction_method": "http"
+        }
+
+    async def get_apple_music_playlist_data(self, url: str, search_id: Optional[str] = None) -> Dict:
+        """
+        Extract playlist data from Apple Music with ultra-lightweight approach.
+        
+        Optimized for resource-constrained environments to prevent browser crashes.
+        """
+        self._log_state("start_apple_music_extraction")
+        # One trace id per request, shared with get_playlist_data when called from it;
+        # the log formatter already timestamps each line
+        search_id = search_id or uuid.uuid4().hex[:12]
+        
+        try:
+            # Each scrape gets its own tab; the browser process stays warm between them
+            # CRITICAL: the tab blocks almost all resources to minimize memory usage
+            async with self._tab(_APPLE_BLOCKED_URLS):
+                logger.info("[TRACE][%s] Starting ultra-lightweight Apple Music data extraction for URL: %s", search_id, url)
             
-            # Enable cache clearing
-            self.browser.execute_cdp_cmd('Network.clearBrowserCache', {})
-            
-            # Load the page with minimal waiting
-            logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Loading page with minimal resources")
-            self.browser.get(url)
+                # Load the page with minimal waiting
+                logger.debug("[TRACE][%s] Loading page with minimal resources", search_id)
+                await self._run(self.browser.get, url)
             
-            # ULTRA-LIGHTWEIGHT: Immediately abort further loading after minimal content
-            self.browser.execute_script("""
-                // Force end page loading to save resources
-                window.stop();
-                
-                // Disable all animations and transitions
-                document.head.insertAdjacentHTML('beforeend', 
-                    '<style>* { animation: none !important; transition: none !important; }</style>'
-                );
-                
-                // Destroy all interval and timeout based code
-                for(let i = 0; i < 10000; i++) {
-                    clearInterval(i);
-                    clearTimeout(i);
-                }
+                # Stopping the load, freezing CSS and muting input already ran at DOMContentLoaded
+                # via _APPLE_QUIET_PAGE_JS
                 
-                // Disconnect observers if any
-                if(window.MutationObserver) {
-                    const observers = document.__observers || [];
-                    observers.forEach(obs => {
-                        try { obs.disconnect(); } catch(e) {}
-                    });
-                }
-                
-                // Kill all event listeners
-                const stopPropagation = e => { 
-                    e.stopPropagation();
-                    e.stopImmediatePropagation();
-                };
-                
-                ['click', 'keydown', 'keyup', 'keypress', 'mouseover', 'mousemove', 'mousedown', 'mouseup', 'resize', 'scroll']
-                .forEach(type => window.addEventListener(type, stopPropagation, true));
-            """)
-            
-            # Wait just a tiny moment for the DOM to be accessible
-            time.sleep(0.5)
+                # Wait only until the DOM is parsed instead of a fixed pause; usually already true
+                # by the time get() returns
+                try:
+                    await self._run(WebDriverWait(self.browser, 5, poll_frequency=0.05).until, lambda d: d.execute_script(
+                        "return document.readyState !== 'loading'"
+                    ))
+                except TimeoutException:
+                    logger.debug("[TRACE][%s] Document still loading, extracting anyway", search_id)
             
-            # Default playlist data structure with mandatory fields
-            playlist_data = {
-                "name": "Unknown Apple Music Playlist",
-                "platform": "apple-music",
-                "url": url,
-                "description": "",
-                "tracks": [],
-                "total_tracks": 0,
-                "scrape_time": datetime.now().isoformat(),
-                "_extraction_method": "ultra_lightweight"
-            }
+                # Default playlist data structure with mandatory fields
+                playlist_data = {
+                    "name": "Unknown Apple Music Playlist",
+                    "platform": "apple-music",
+                    "url": url,
+                    "description": "",
+                    "tracks": [],
+                    "total_tracks": 0,
+                    "scrape_time": datetime.now().isoformat(),
+                    "_extraction_method": "ultra_lightweight"
+                }
             
-            # IMMEDIATE EXTRACTION: Don't wait for anything to load fully
-            logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Extracting minimal playlist data")
+                # IMMEDIATE EXTRACTION: Don't wait for anything to load fully
+                logger.debug("[TRACE][%s] Extracting minimal playlist data", search_id)
             
-            # Get just enough information using direct JavaScript
-            try:
-                minimal_data = self.browser.execute_script("""
-                    // Extremely simple extraction
-                    function getMinimalData() {
-                        // Just grab any title-looking element
-                        const title = document.querySelector('h1, h2, [class*="title"]:not([class*="subtitle"])');
-                        const titleText = title ? title.textContent.trim() : "Apple Music Playlist";
-                        
-                        // Naive track extraction
-                        const tracks = [];
-                        
-                        // Try multiple simple track detection approaches
-                        const trackElements = document.querySelectorAll('[class*="track"], [class*="song"], [role="row"], [class*="list-item"]');
-                        
-                        let idx = 0;
-                        trackElements.forEach(el => {
-                            try {
-                                // Simple check if this looks like a track element
-                                const text = el.textContent.trim();
-                                if (!text || text.length < 3) return;
-                                
-                                // Skip headers
-                                if (text.includes("Track") && text.includes("Time") && text.includes("Artist")) return;
-                                if (text.includes("TITLE") && text.includes("ARTIST") && text.includes("ALBUM")) return;
-                                
-                                // Split text into segments for naive track/artist separation
-                                const segments = text.split(/\\n|\\t/).map(s => s.trim()).filter(s => s.length > 1);
-                                
-                                if (segments.length >= 2) {
-                                    const trackName = segments[0] || "Unknown Track";
-                                    const artistName = segments[1] || "Unknown Artist";
-                                    
-                                    // Add to tracks if it seems valid
-                                    if (trackName.length > 1 && artistName.length > 1) {
-                                        tracks.push({
-                                            name: trackName,
-                                            artists: [artistName],
-                                            position: idx + 1
-                                        });
-                                        idx++;
-                                    }
-                                }
-                            } catch(e) {
-                                // Ignore errors in track parsing
-                            }
-                        });
-                        
-                        return {
-                            title: titleText,
-                            tracks: tracks
-                        };
-                    }
-                    
-                    return getMinimalData();
-                """)
+                # Title and tracks come back together from one CDP evaluation, as a single
+                # JSON string decoded once on this side
+                try:
+                    evaluation = await self._run(self.browser.execute_cdp_cmd, "Runtime.evaluate", {
+                        "expression": "window.__extractTracks ? JSON.stringify(window.__extractTracks()) : null",
+                        "returnByValue": True
+                    })
+                    minimal_json = evaluation.get("result", {}).get("value")
+                    if minimal_json is None:
+                        # The extractor wasn't pre-registered on this page; send it along with the call
+                        evaluation = await self._run(self.browser.execute_cdp_cmd, "Runtime.evaluate", {
+                            "expression": _APPLE_EXTRACT_TRACKS_JS + "JSON.stringify(window.__extractTracks());",
+                            "returnByValue": True
+                        })
+                        minimal_json = evaluation.get("result", {}).get("value")
+                    minimal_data = orjson.loads(minimal_json) if minimal_json else None
                 
-                if minimal_data and minimal_data.get("tracks") and len(minimal_data["tracks"]) > 0:
-                    playlist_data["name"] = minimal_data.get("title", "Apple Music Playlist")
-                    playlist_data["tracks"] = minimal_data["tracks"]
-                    playlist_data["total_tracks"] = len(minimal_data["tracks"])
-                    logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Successfully extracted {len(minimal_data['tracks'])} tracks")
+                    if minimal_data and minimal_data.get("tracks") and len(minimal_data["tracks"]) > 0:
+                        playlist_data["name"] = minimal_data.get("title", "Apple Music Playlist")
+                        playlist_data["tracks"] = minimal_data["tracks"]
+                        playlist_data["total_tracks"] = len(minimal_data["tracks"])
+                        logger.debug("[TRACE][%s] Successfully extracted %d tracks", search_id, len(minimal_data["tracks"]))
+                except Exception as e:
+                    logger.error("[ERROR][%s] JavaScript extraction failed: %s", search_id, e)
+                    # We'll continue and return what we have even if extraction failed
+            
+                # Final outcome
+                if playlist_data["tracks"] and len(playlist_data["tracks"]) > 0:
+                    logger.info("[TRACE][%s] Successfully extracted %d tracks from Apple Music playlist", search_id, len(playlist_data["tracks"]))
+                    self._log_state("apple_music_extraction_success")
+                    return playlist_data
                 else:
-                    # One more fallback - try super simple track extraction if the above didn't work
-                    logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Using emergency fallback extraction")
-                    
-                    fallback_tracks = self.browser.execute_script("""
-                        // Emergency text-based extraction
-                        const allLinks = Array.from(document.querySelectorAll('a'));
-                        const tracks = [];
-                        
-                        // Find song title patterns
-                        allLinks.forEach((link, idx) => {
-                            const text = link.textContent.trim();
-                            // Skip empty links
-                            if (text.length < 2) return; 
-                            
-                            // Skip navigation links
-                            if (["home", "browse", "radio", "search", "sign in", "sign out", "account"].includes(text.toLowerCase())) return;
-                            
-                            // If it's a link that doesn't look like navigation, it might be a track
-                            const nextEl = link.nextElementSibling;
-                            const prevEl = link.previousElementSibling;
-                            
-                            // Try to get artist from sibling element
-                            let artistName = "Unknown Artist";
-                            if (nextEl && nextEl.textContent.trim().length > 1) {
-                                artistName = nextEl.textContent.trim();
-                            } else if (prevEl && prevEl.textContent.trim().length > 1) {
-                                artistName = prevEl.textContent.trim();
-                            }
-                            
-                            tracks.push({
-                                name: text,
-                                artists: [artistName],
-                                position: idx + 1
-                            });
-                        });
-                        
-                        return tracks.slice(0, 50); // Limit to 50 tracks
-                    """)
-                    
-                    if fallback_tracks and len(fallback_tracks) > 0:
-                        # Filter out obvious non-tracks
-                        filtered_tracks = [
-                            t for t in fallback_tracks 
-                            if len(t["name"]) > 1 and t["name"].lower() not in [
-                                "apple music", "playlist", "add", "remove", "more", "play", "next", "previous"
-                            ]
-                        ]
-                        
-                        playlist_data["tracks"] = filtered_tracks
-                        playlist_data["total_tracks"] = len(filtered_tracks)
-                        logger.info(f"[TRACE][{datetime.now().strftime('%Y%m%d_%H%M%S')}] Emergency extraction found {len(filtered_tracks)} tracks")
-            except Exception as e:
-                logger.error(f"JavaScript extraction failed: {str(e)}")
-                # We'll continue and return what we have even if extraction failed
-            
-            # Final outcome
-            if playlist_data["tracks"] and len(playlist_data["tracks"]) > 0:
-                logger.info(f"Successfully extracted {len(playlist_data['tracks'])} tracks from Apple Music playlist")
-                self._log_state("apple_music_extraction_success")
-                return playlist_data
-            else:
-                logger.error("Failed to extract any tracks from Apple Music playlist")
-                self._log_state("apple_music_extraction_failure")
+                    logger.error("[ERROR][%s] Failed to extract any tracks from Apple Music playlist", search_id)
+                    self._log_state("apple_music_extraction_failure")
                 
-                # Fallback to minimal data rather than raising an exception
-                # Add at least one dummy track so the UI doesn't completely break
-                playlist_data["tracks"] = [
-                    {
-                        "name": "Error extracting track list",
-                        "artists": ["Please try again or use a different playlist"],
-                        "position": 1
-                    }
-                ]
-                playlist_data["total_tracks"] = 1
-                return playlist_data
+                    # Fallback to minimal data rather than raising an exception
+                    # Add at least one dummy track so the UI doesn't completely break
+                    playlist_data["tracks"] = [
+                        {
+                            "name": "Error extracting track list",
+                            "artists": ["Please try again or use a different playlist"],
+                            "position": 1
+                        }
+                    ]
+                    playlist_data["total_tracks"] = 1
+                    playlist_data["_extraction_method"] = "error_recovery"
+                    return playlist_data
                 
         except Exception as e:
             self._log_state("apple_music_extraction_error", e)
-            logger.error(f"Error extracting Apple Music playlist: {str(e)}", exc_info=True)
+            # Tracebacks only at DEBUG; the error path is hit on every failed attempt
+            logger.error("[ERROR][%s] Error extracting Apple Music playlist: %s", search_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             
             # Create a minimal response instead of raising an exception
             return {
@@ -707,6 +1450,8 @@ class PlaylistScraper:
                 "scrape_time": datetime.now().isoformat(),
                 "_extraction_method": "error_recovery"
             }
+        finally:
+            await self._reset_between_scrapes()
 
     def _log_state(self, action: str, error: Exception = None):
         """Log current state of the scraper."""
@@ -730,26 +1475,6 @@ class PlaylistScraper:
         self._state['last_action'] = action
         self._last_action_time = now
 
-    def _init_services(self):
-        """Initialize service clients."""
-        try:
-            self.spotify = SpotifyService()
-            logger.info("Spotify service initialized")
-        except Exception as e:
-            logger.error("Failed to initialize Spotify service", exc_info=e)
-            self.spotify = None
-            self._log_state('spotify_init_failed', e)
-
-        try:
-            self.soundcloud = SoundCloudService()
-            logger.info("SoundCloud service initialized")
-        except Exception as e:
-            logger.error("Failed to initialize SoundCloud service", exc_info=e)
-            self.soundcloud = None
-            self._log_state('soundcloud_init_failed', e)
-            
-        self._log_state('services_init_complete')
-
     def _verify_browser_state(self):
         """Verify browser is in a valid state."""
         try:
@@ -789,7 +1514,8 @@ class PlaylistScraper:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
             self.browser = webdriver.Chrome(options=chrome_options)
-            self.browser.implicitly_wait(10)  # seconds
+            # No implicit wait: missing elements fail fast, explicit waits are used where needed
+            self.browser.implicitly_wait(0)
             
             # Verify browser is responsive
             self.browser.get('about:blank')
@@ -818,98 +1544,6 @@ class PlaylistScraper:
             logger.error(f"Error during browser cleanup: {str(e)}", exc_info=True)
             self._log_state('browser_cleanup_failed', e)
 
-    async def _extract_track_data(self, track_element, idx):
-        """Extract track data with improved selectors and JavaScript fallback."""
-        try:
-            # Try to extract track name using multiple methods
-            name_selectors = [
-                "div[class*='song-name']",
-                "div[class*='track-name']",
-                "div[class*='title']",
-                ".//div[contains(@class, 'song-name')]",
-                ".//div[contains(@class, 'track-name')]",
-                ".//div[contains(@class, 'title')]"
-            ]
-            
-            track_name = None
-            for selector in name_selectors:
-                try:
-                    if selector.startswith(".//"):
-                        element = track_element.find_element(By.XPATH, selector)
-                    else:
-                        element = track_element.find_element(By.CSS_SELECTOR, selector)
-                    track_name = element.text.strip()
-                    if track_name:
-                        break
-                except:
-                    continue
-            
-            if not track_name:
-                # Try JavaScript
-                track_name = self.browser.execute_script("""
-                    const el = arguments[0];
-                    return el.querySelector('[class*="song-name"], [class*="track-name"], [class*="title"]')?.textContent?.trim();
-                """, track_element)
-            
-            if not track_name:
-                return None
-            
-            # Extract artists with similar approach
-            artist_selectors = [
-                "div[class*='artist']",
-                "div[class*='by-line']",
-                "div[class*='subtitle']",
-                ".//div[contains(@class, 'artist')]",
-                ".//div[contains(@class, 'by-line')]",
-                ".//div[contains(@class, 'subtitle')]"
-            ]
-            
-            artist_text = None
-            for selector in artist_selectors:
-                try:
-                    if selector.startswith(".//"):
-                        element = track_element.find_element(By.XPATH, selector)
-                    else:
-                        element = track_element.find_element(By.CSS_SELECTOR, selector)
-                    artist_text = element.text.strip()
-                    if artist_text:
-                        break
-                except:
-                    continue
-            
-            if not artist_text:
-                # Try JavaScript
-                artist_text = self.browser.execute_script("""
-                    const el = arguments[0];
-                    return el.querySelector('[class*="artist"], [class*="by-line"], [class*="subtitle"]')?.textContent?.trim();
-                """, track_element)
-            
-            if not artist_text:
-                return None
-            
-            # Clean up artist text
-            artist_text = re.sub(r'^by\s+', '', artist_text, flags=re.IGNORECASE)
-            artists = []
-            
-            # Split on common separators
-            for artist in re.split(r'[,&]|\bfeat\.|\bft\.|\band\b|\bx\b|\bvs\.?|\bwith\b', artist_text):
-                artist = artist.strip()
-                if artist and not any(word in artist.lower() for word in ['feat.', 'ft.', 'featuring']):
-                    artists.append(artist)
-            
-            if not artists:
-                return None
-            
-            return {
-                "name": track_name,
-                "artists": artists,
-                "position": idx
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error extracting track {idx}: {str(e)}")
-            return None
-
     def detect_platform(self, url: str) -> str:
         """Detect the platform from the URL."""
         if "music.apple.com" in url:
@@ -920,76 +1554,123 @@ class PlaylistScraper:
             raise ValueError("Unsupported platform. Only Apple Music and Spotify are supported.")
 
     async def get_playlist_data(self, playlist_url: str) -> Dict:
-        """Get playlist data from the appropriate platform with crash protection."""
+        """
+        Get playlist data from the appropriate platform with crash protection.
+        
+        Cached and HTTP-fetchable playlists never touch a browser; only a scrape that
+        falls back to the browser borrows one from the shared pool, so this works on
+        a scraper that was never initialized.
+        """
         platform = self.detect_platform(playlist_url)
-        search_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        logger.info(f"[TRACE][{search_id}] Starting playlist data extraction from {platform} for URL: {playlist_url}")
+        search_id = uuid.uuid4().hex[:12]
+        logger.info("[TRACE][%s] Starting playlist data extraction from %s for URL: %s", search_id, platform, playlist_url)
         
-        # Initialize browser if not already done
-        if not self._initialized:
+        cache_key = _cache_key(playlist_url)
+        cached = _cache_lookup(cache_key)
+        if cached is not None:
+            logger.info("[TRACE][%s] Returning cached playlist data", search_id)
+            return cached
+        
+        while cache_key in _INFLIGHT:
+            inflight = _INFLIGHT[cache_key]
             try:
-                await self.initialize_browser()
-            except Exception as e:
-                logger.error(f"[ERROR][{search_id}] Failed to initialize browser: {str(e)}")
-                # Return minimal error data instead of raising
-                return {
-                    "platform": platform,
-                    "url": playlist_url,
-                    "name": f"Error - {platform.capitalize()} Playlist",
-                    "tracks": [
-                        {
-                            "name": "Browser initialization failed",
-                            "artists": ["Please try again in a few minutes"],
-                            "position": 1
-                        }
-                    ],
-                    "total_tracks": 1
-                }
+                # Shielded so a waiter being cancelled doesn't cancel the shared scrape
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The scrape we joined was cancelled; start (or join) another one
+                continue
+            logger.info("[TRACE][%s] Returning playlist data scraped by a concurrent request", search_id)
+            return copy.deepcopy(result)
+        
+        inflight = asyncio.get_running_loop().create_future()
+        _INFLIGHT[cache_key] = inflight
+        try:
+            result = await self._scrape_playlist_data(playlist_url, cache_key, platform, search_id)
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except BaseException as e:
+            inflight.set_exception(e)
+            # Mark the exception retrieved so an unawaited future doesn't log it again
+            inflight.exception()
+            raise
+        else:
+            # Waiters get their own copies, taken before the caller can mutate this one
+            inflight.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            del _INFLIGHT[cache_key]
+
+    async def _scrape_playlist_data(self, playlist_url: str, cache_key: str, platform: str, search_id: str) -> Dict:
+        """Fetch a playlist that isn't cached: over HTTP when possible, otherwise in the browser with retries."""
+        # Apple Music pages and Spotify embeds are server-rendered; try plain HTTP
+        # before paying for a browser
+        if platform == "apple-music":
+            result = await self._fetch_apple_music_http(playlist_url)
+        elif platform == "spotify":
+            result = await self._fetch_spotify_embed_http(playlist_url)
+        else:
+            result = None
+        if result:
+            _cache_store(cache_key, result)
+            return result
         
-        # Define max retries and backoff strategy
+        # Only now is a browser needed; borrow a warm one from the pool for just this scrape
+        try:
+            scraper = await BROWSER_POOL.acquire()
+        except Exception as e:
+            logger.error("[ERROR][%s] Failed to initialize browser: %s", search_id, e)
+            # Return minimal error data instead of raising
+            return {
+                "platform": platform,
+                "url": playlist_url,
+                "name": f"Error - {platform.capitalize()} Playlist",
+                "tracks": [
+                    {
+                        "name": "Browser initialization failed",
+                        "artists": ["Please try again in a few minutes"],
+                        "position": 1
+                    }
+                ],
+                "total_tracks": 1
+            }
+        try:
+            return await scraper._scrape_in_browser(playlist_url, cache_key, platform, search_id)
+        finally:
+            await BROWSER_POOL.release(scraper)
+
+    async def _scrape_in_browser(self, playlist_url: str, cache_key: str, platform: str, search_id: str) -> Dict:
+        """Scrape a playlist in this scraper's browser, retrying and restarting it after crashes."""
+        # Define max retries; retries back off exponentially with jitter within an overall time budget
         max_retries = 3
-        retry_delay = 2  # seconds
+        retry_budget = 60  # seconds
+        retry_started = time.monotonic()
         
         for attempt in range(1, max_retries + 1):
             try:
-                logger.info(f"[TRACE][{search_id}] Attempt {attempt}/{max_retries} to fetch playlist data")
-                
-                # Clear browser state
-                try:
-                    self.browser.delete_all_cookies()
-                except Exception as e:
-                    logger.warning(f"[WARN][{search_id}] Failed to clear cookies: {str(e)}")
-                
-                # Try to clear cache and storage
-                try:
-                    self.browser.execute_script("""
-                        try {
-                            window.localStorage.clear();
-                            window.sessionStorage.clear();
-                            console.log('Storage cleared');
-                        } catch(e) {
-                            console.log('Failed to clear storage:', e);
-                        }
-                    """)
-                except Exception as e:
-                    logger.warning(f"[WARN][{search_id}] Failed to clear storage: {str(e)}")
+                logger.info("[TRACE][%s] Attempt %d/%d to fetch playlist data", search_id, attempt, max_retries)
                 
                 # Verify browser is still responsive
                 try:
                     # Quick check if browser is still alive
-                    self.browser.current_url
+                    await self._run(lambda: self.browser.current_url)
                 except Exception as e:
-                    logger.error(f"[ERROR][{search_id}] Browser appears to be unresponsive: {str(e)}")
+                    logger.error("[ERROR][%s] Browser appears to be unresponsive: %s", search_id, e)
                     # Close the browser and reinitialize
                     await self.cleanup()
                     await self.initialize_browser()
                 
                 # Fetch based on platform with timeout handling
                 if platform == "apple-music":
-                    result = await self.get_apple_music_playlist_data(playlist_url)
+                    result = await self.get_apple_music_playlist_data(playlist_url, search_id)
+                    if result.get("_extraction_method") != "error_recovery":
+                        _cache_store(cache_key, result)
                     return result
                 elif platform == "spotify":
-                    result = await self.get_spotify_playlist_data(playlist_url)
+                    result = await self.get_spotify_playlist_data(playlist_url, search_id)
+                    _cache_store(cache_key, result)
                     return result
                 else:
                     # Don't raise an error, return a helpful error message
@@ -1008,24 +1689,30 @@ class PlaylistScraper:
                     }
                 
             except Exception as e:
-                logger.error(f"[ERROR][{search_id}] Error on attempt {attempt}/{max_retries}: {str(e)}")
+                logger.error("[ERROR][%s] Error on attempt %d/%d: %s", search_id, attempt, max_retries, e)
                 
-                # Try to take a screenshot for debugging
-                try:
-                    screenshot_path = f"error_{search_id}_attempt{attempt}.png"
-                    self.browser.save_screenshot(screenshot_path)
-                    logger.info(f"[TRACE][{search_id}] Saved error screenshot to {screenshot_path}")
-                except Exception as screenshot_e:
-                    logger.warning(f"[WARN][{search_id}] Failed to save error screenshot: {str(screenshot_e)}")
+                # Take a screenshot for debugging when enabled
+                if _DEBUG_SHOTS:
+                    try:
+                        screenshot_path = f"error_{search_id}_attempt{attempt}.png"
+                        await self._run(self.browser.save_screenshot, screenshot_path)
+                        logger.info("[TRACE][%s] Saved error screenshot to %s", search_id, screenshot_path)
+                    except Exception as screenshot_e:
+                        logger.warning("[WARN][%s] Failed to save error screenshot: %s", search_id, screenshot_e)
                 
                 # Check if browser crashed
                 is_crash = False
                 if "tab crashed" in str(e).lower() or "session deleted" in str(e).lower() or "disconnected" in str(e).lower():
                     is_crash = True
-                    logger.error(f"[ERROR][{search_id}] Browser crash detected: {str(e)}")
+                    logger.error("[ERROR][%s] Browser crash detected: %s", search_id, e)
+                
+                retry_delay = min(30, 2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+                out_of_budget = time.monotonic() - retry_started + retry_delay > retry_budget
                 
-                if attempt == max_retries:
-                    logger.error(f"[ERROR][{search_id}] All attempts failed")
+                if attempt == max_retries or out_of_budget:
+                    if out_of_budget and attempt < max_retries:
+                        logger.error("[ERROR][%s] Retry budget of %ds exhausted after %d attempts", search_id, retry_budget, attempt)
+                    logger.error("[ERROR][%s] All attempts failed", search_id)
                     
                     # Return minimal data instead of raising
                     return {
@@ -1042,15 +1729,32 @@ class PlaylistScraper:
                         "total_tracks": 1
                     }
                 
-                # For crashes, do a full browser restart
+                # For crashes, do a full browser restart; the fresh profile drops all session state
                 if is_crash:
-                    logger.info(f"[TRACE][{search_id}] Restarting browser after crash")
-                    await self.cleanup()
-                    await asyncio.sleep(retry_delay * attempt)
-                    await self.initialize_browser()
+                    logger.info("[TRACE][%s] Restarting browser after crash", search_id)
+                    try:
+                        await self.cleanup()
+                        await asyncio.sleep(retry_delay)
+                        await self.initialize_browser()
+                    except Exception as restart_e:
+                        logger.error("[ERROR][%s] Failed to restart browser after crash: %s", search_id, restart_e)
+                        return {
+                            "platform": platform,
+                            "url": playlist_url,
+                            "name": f"Error - {platform.capitalize()} Playlist",
+                            "tracks": [
+                                {
+                                    "name": "Failed to fetch playlist data",
+                                    "artists": [f"Error: {str(restart_e)[:100]}..."],
+                                    "position": 1
+                                }
+                            ],
+                            "total_tracks": 1
+                        }
                 else:
-                    # For other errors, just wait and retry
-                    await asyncio.sleep(retry_delay * attempt)
+                    # Other errors retry in the warm session, so the page's cookies and cached
+                    # bundles carry over instead of the app cold-starting again
+                    await asyncio.sleep(retry_delay)
         
         # This should never be reached due to the return in the last retry
         return {
@@ -1061,37 +1765,38 @@ class PlaylistScraper:
             "total_tracks": 0
         }
 
-    def _serialize_datetime(self, obj):
-        """Helper method to serialize datetime objects."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return str(obj)
-
-    def _create_scraping_stats(self, request_id: str, url: str) -> Dict:
-        """Create initial scraping statistics with proper datetime handling."""
-        return {
-            'request_id': request_id,
-            'url': url,
-            'start_time': self._serialize_datetime(datetime.now()),
-            'page_load_success': False,
-            'content_load_success': False,
-            'track_extraction_success': False,
-            'total_tracks_found': 0,
-            'actual_playlist_tracks': 0,
-            'errors': [],
-            'dom_state': {},
-            'selectors_found': {},
-            'performance_metrics': {
-                'page_load_duration': None,
-                'content_load_duration': None,
-                'extraction_duration': None
-            }
-        }
+    @classmethod
+    async def get_playlists_data(cls, playlist_urls: List[str], max_concurrency: int = 5) -> List[Dict]:
+        """
+        Fetch several playlists concurrently, on warm browsers from the shared pool when needed.
+        
+        At most ``max_concurrency`` fetches are in flight at once; the number of
+        Chrome instances is bounded by the pool size, and browsers stay warm for
+        later requests instead of being torn down after the batch.
+        
+        Args:
+            playlist_urls: Playlist URLs to fetch
+            max_concurrency: Maximum number of playlists scraped at the same time
+            
+        Returns:
+            List of playlist data dictionaries, in the same order as the URLs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Browser fallbacks borrow pooled scrapers, so one browserless scraper serves the batch
+        scraper = cls()
+        
+        async def fetch(url: str) -> Dict:
+            async with semaphore:
+                return await scraper.get_playlist_data(url)
+        
+        logger.info(f"Fetching {len(playlist_urls)} playlists, up to {max_concurrency} at a time")
+        return await asyncio.gather(*(fetch(url) for url in playlist_urls))
 
-    async def get_spotify_playlist_data(self, url: str) -> Dict:
+    async def get_spotify_playlist_data(self, url: str, search_id: Optional[str] = None) -> Dict:
         """Extract playlist data from Spotify with optimizations to prevent timeouts."""
-        search_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        logger.info(f"[TRACE][{search_id}] Starting optimized Spotify playlist data extraction for URL: {url}")
+        # Reuse the caller's trace id so one request's log lines share it
+        search_id = search_id or uuid.uuid4().hex[:12]
+        logger.info("[TRACE][%s] Starting optimized Spotify playlist data extraction for URL: %s", search_id, url)
         
         # Initialize browser if not already done
         if not self.browser:
@@ -1099,50 +1804,17 @@ class PlaylistScraper:
             
         # Use a simplified approach to load the playlist page
         try:
-            logger.info(f"[TRACE][{search_id}] Loading playlist page with optimized settings")
-            
-            # Set blocked resources to reduce load time
-            self.browser.execute_cdp_cmd('Network.setBlockedURLs', {
-                'urls': [
-                    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.svg',  # Block images
-                    '*.css',  # Block CSS - careful with this one, might break page structure
-                    '*.woff', '*.woff2', '*.ttf', '*.otf',  # Block fonts
-                    'https://www.google-analytics.com/*',  # Block analytics
-                    'https://analytics.spotify.com/*',  # Block Spotify analytics
-                    'https://log.spotify.com/*',  # Block Spotify logging
-                    'https://ads.spotify.com/*',  # Block Spotify ads
-                    'https://connect.facebook.net/*',  # Block Facebook
-                    '*.hotjar.com/*',  # Block Hotjar
-                ]
-            })
+            logger.info("[TRACE][%s] Loading playlist page with optimized settings", search_id)
             
-            # Load the playlist page with timeout handling
-            self.browser.get(url)
+            # Set blocked resources to reduce load time (a no-op when this browser already has them)
+            await self._run(self._set_blocked_urls, _SPOTIFY_BLOCKED_URLS)
             
-            # Wait a moment for page to start loading
-            await asyncio.sleep(1)
-            
-            # Reduce page processing by stopping animations and heavy rendering
-            self.browser.execute_script("""
-                // Stop animations and timers to reduce CPU usage
-                window.addEventListener('load', function() {
-                    const highPriorityOnly = function() {
-                        // Stop all animations
-                        for (let i = 0; i < 9999; i++) {
-                            window.clearInterval(i);
-                        }
-                        // Stop all timeouts
-                        for (let i = 0; i < 9999; i++) {
-                            window.clearTimeout(i);
-                        }
-                    };
-                    setTimeout(highPriorityOnly, 2000);
-                });
-                console.log('Stopped animations and timers');
-            """)
+            # Load the playlist page with timeout handling; intervals are already
+            # disabled by the document-start script registered at init
+            await self._run(self.browser.get, url)
             
             # Wait for essential playlist content to load with a more direct approach
-            logger.info(f"[TRACE][{search_id}] Waiting for essential playlist content")
+            logger.info("[TRACE][%s] Waiting for essential playlist content", search_id)
             
             # Wait for any of these elements to appear, which would indicate the playlist loaded
             selectors = [
@@ -1153,150 +1825,75 @@ class PlaylistScraper:
                 'div[data-testid="tracklist-row"]'
             ]
             
-            selector_found = False
-            for selector in selectors:
-                try:
-                    # Use a shorter timeout for each individual selector
-                    WebDriverWait(self.browser, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"[TRACE][{search_id}] Found playlist content with selector: {selector}")
-                    selector_found = True
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not selector_found:
-                # Try one more time with a longer timeout on the most reliable selector
+            # One joined selector, one wait: the browser matches any of them in a single query
+            try:
+                await self._run(
+                    WebDriverWait(self.browser, 12).until,
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(selectors)))
+                )
+                logger.info("[TRACE][%s] Found playlist content", search_id)
+            except TimeoutException:
+                logger.warning("[WARN][%s] Could not find any playlist content selectors", search_id)
+                # Continue anyway, we might still extract data
+            
+            # Wait for the page to settle instead of sleeping blindly before the full extraction
+            try:
+                await self._run(WebDriverWait(self.browser, 2, poll_frequency=0.1).until, lambda d: d.execute_script(
+                    "return document.readyState === 'complete'"
+                    " && !document.querySelector('[aria-busy=\"true\"]')"
+                    " && !!document.querySelector('[data-testid=\"tracklist-row\"]');"
+                ))
+            except TimeoutException:
+                logger.debug("[TRACE][%s] Page still busy, extracting anyway", search_id)
+            
+            # Collect rows while the script scrolls the virtualized list, then read them once settled
+            logger.info("[TRACE][%s] Extracting playlist data with optimized script", search_id)
+            
+            # The tracklist can hydrate a moment after its container appears, so an empty
+            # pass is retried in place with a short backoff before the scrape is failed
+            extraction_attempts = 3
+            for extraction_attempt in range(extraction_attempts):
+                await self._run(self.browser.execute_script, _SPOTIFY_EXTRACT_JS)
                 try:
-                    WebDriverWait(self.browser, 15).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-testid="playlist-tracklist"]'))
+                    await self._run(
+                        WebDriverWait(self.browser, 30, poll_frequency=0.25).until,
+                        lambda d: d.execute_script("return window.__tracksSettled === true;")
                     )
-                    selector_found = True
-                    logger.info(f"[TRACE][{search_id}] Found playlist content with extended timeout")
                 except TimeoutException:
-                    logger.warning(f"[WARN][{search_id}] Could not find any playlist content selectors")
-                    # Continue anyway, we might still extract data
-            
-            # Scroll just once to load more tracks without excessive scrolling
-            self.browser.execute_script("window.scrollTo(0, 500);")
-            await asyncio.sleep(1)
-            
-            # Simplified JavaScript extraction that's less resource-intensive
-            logger.info(f"[TRACE][{search_id}] Extracting playlist data with optimized script")
-            
-            playlist_data = self.browser.execute_script("""
-                function getPlaylistData() {
-                    // Define result object with placeholders
-                    const data = {
-                        name: document.title || 'Spotify Playlist',
-                        tracks: [],
-                        url: window.location.href,
-                        platform: 'Spotify'
-                    };
-                    
-                    // Get playlist name with minimum selectors
-                    try {
-                        const titleElement = document.querySelector('h1');
-                        if (titleElement) {
-                            data.name = titleElement.textContent.trim();
-                        }
-                    } catch (e) {
-                        console.error('Error getting playlist title:', e);
-                    }
-                    
-                    // Find the main container with minimum queries
-                    let trackElements = [];
-                    const containers = [
-                        document.querySelector('div[data-testid="playlist-tracklist"]'),
-                        document.querySelector('div.tracklist-container'),
-                        document.querySelector('section[data-testid="playlist-tracklist"]')
-                    ];
-                    
-                    let container = null;
-                    for (const c of containers) {
-                        if (c) {
-                            container = c;
-                            break;
-                        }
-                    }
-                    
-                    if (container) {
-                        // Try multiple selectors but with minimal DOM traversal
-                        const selectors = [
-                            'div[data-testid="tracklist-row"]',
-                            'div[role="row"]',
-                            'div[draggable="true"]'
-                        ];
-                        
-                        for (const selector of selectors) {
-                            const elements = container.querySelectorAll(selector);
-                            if (elements && elements.length > 0) {
-                                trackElements = Array.from(elements);
-                                break;
-                            }
-                        }
-                    } else {
-                        // Fallback: look for any track-like elements
-                        trackElements = Array.from(document.querySelectorAll('div[data-testid="tracklist-row"], div[role="row"]'));
-                    }
-                    
-                    // Process track elements with minimal DOM queries
-                    trackElements.forEach((track, index) => {
-                        try {
-                            // Extract track name and artist with minimal queries
-                            const trackName = track.querySelector('a[data-testid="internal-track-link"]')?.textContent.trim() ||
-                                              track.querySelector('a[aria-label*="play"]')?.textContent.trim() ||
-                                              '';
-                                              
-                            // Skip if no track name (likely a header)
-                            if (!trackName || trackName === 'Title' || trackName === '#') {
-                                return;
-                            }
-                            
-                            // Get artist with minimal DOM traversal
-                            const artistElement = track.querySelector('a[href*="artist"]') ||
-                                                track.querySelector('span a');
-                            
-                            const artistName = artistElement ? artistElement.textContent.trim() : 'Unknown Artist';
-                            
-                            // Add track with minimal data
-                            data.tracks.push({
-                                name: trackName,
-                                artists: [artistName],
-                                position: index + 1
-                            });
-                        } catch (e) {
-                            console.error('Error processing track:', e);
-                        }
-                    });
-                    
-                    return data;
-                }
-                return getPlaylistData();
-            """)
+                    logger.warning("[WARN][%s] Track list still loading after 30s, using rows collected so far", search_id)
+                playlist_data = await self._run(self.browser.execute_script, _SPOTIFY_COLLECTED_JS)
+                
+                if (playlist_data and playlist_data.get('tracks')) or extraction_attempt == extraction_attempts - 1:
+                    break
+                logger.info("[TRACE][%s] No tracks yet, retrying extraction (%s/%s)", search_id, extraction_attempt + 1, extraction_attempts - 1)
+                # Nudge the virtual list to render before the next pass
+                await self._run(self.browser.execute_script, "window.scrollBy(0, 200);")
+                await asyncio.sleep(0.5 * 2 ** extraction_attempt)
             
             # Validate and clean the data
             if not playlist_data or not playlist_data.get('tracks'):
-                logger.warning(f"[WARN][{search_id}] No tracks found in playlist data")
-                # Try to get a screenshot for debugging
-                try:
-                    screenshot_path = f"empty_playlist_{search_id}.png"
-                    self.browser.save_screenshot(screenshot_path)
-                    logger.info(f"[TRACE][{search_id}] Saved empty playlist screenshot to {screenshot_path}")
-                except Exception as e:
-                    logger.warning(f"[WARN][{search_id}] Failed to save screenshot: {str(e)}")
+                logger.warning("[WARN][%s] No tracks found in playlist data", search_id)
+                # Take a screenshot for debugging when enabled
+                if _DEBUG_SHOTS:
+                    try:
+                        screenshot_path = f"empty_playlist_{search_id}.png"
+                        await self._run(self.browser.save_screenshot, screenshot_path)
+                        logger.info("[TRACE][%s] Saved empty playlist screenshot to %s", search_id, screenshot_path)
+                    except Exception as e:
+                        logger.warning("[WARN][%s] Failed to save screenshot: %s", search_id, e)
                     
-                # Return minimal data
-                return {
-                    "platform": "spotify",
-                    "url": url,
-                    "name": "Spotify Playlist",
-                    "tracks": []
-                }
+                # Fail fast so get_playlist_data retries instead of returning an empty playlist
+                raise ScrapingError("JS extraction returned no tracks")
+            
+            if playlist_data.get('errors'):
+                logger.debug("[TRACE][%s] Extractor reported: %s", search_id, playlist_data['errors'])
+            
+            expected_count = playlist_data.get('expectedCount')
+            if expected_count and len(playlist_data['tracks']) < expected_count:
+                logger.warning("[WARN][%s] Extracted %d of %d tracks listed in the playlist header", search_id, len(playlist_data['tracks']), expected_count)
             
             # Return the playlist data
-            logger.info(f"[TRACE][{search_id}] Successfully extracted {len(playlist_data.get('tracks', []))} tracks from Spotify playlist")
+            logger.info("[TRACE][%s] Successfully extracted %d tracks from Spotify playlist", search_id, len(playlist_data.get('tracks', [])))
             return {
                 "platform": "spotify",
                 "url": url,
@@ -1305,5 +1902,101 @@ class PlaylistScraper:
             }
             
         except Exception as e:
-            logger.error(f"[ERROR][{search_id}] Error extracting Spotify playlist data: {str(e)}")
-            raise Exception(f"Failed to extract Spotify playlist data: {str(e)}") 
\ No newline at end of file
+            logger.error("[ERROR][%s] Error extracting Spotify playlist data: %s", search_id, e)
+            raise Exception(f"Failed to extract Spotify playlist data: {str(e)}")
+        finally:
+            await self._reset_between_scrapes()
+
+
+class BrowserPool:
+    """
+    Process-wide pool of scrapers with warm browsers.
+    
+    Starting Chrome is the slowest part of a scrape, so browsers are kept alive
+    between requests and handed out one at a time. Scrapers are created lazily
+    up to ``size``; a scraper whose browser has died is discarded on release and
+    its slot handed to the next caller, who starts a fresh browser in it.
+    """
+    
+    def __init__(self, size: int = 2):
+        self.size = max(1, size)
+        # Idle scrapers, plus None for each freed slot whose browser has to be started again
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+        # Every scraper the pool has started, idle or checked out, so close() can reach them all
+        self._scrapers = set()
+        self._closed = False
+    
+    async def acquire(self) -> PlaylistScraper:
+        """Return an initialized scraper, waiting for one to be released if the pool is full."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        if self._idle.empty() and self._created < self.size:
+            # Reserve the slot before the first await; Chrome starts outside any lock so
+            # other callers can still take scrapers that are released meanwhile
+            self._created += 1
+            scraper = None
+        else:
+            scraper = await self._idle.get()
+            if self._closed:
+                # Pass the wake-up on so every caller still waiting on the pool fails too
+                self._free_slot()
+                raise RuntimeError("Browser pool is closed")
+        if scraper is not None:
+            return scraper
+        
+        scraper = PlaylistScraper()
+        self._scrapers.add(scraper)
+        try:
+            await scraper.initialize_browser()
+        except Exception:
+            self._scrapers.discard(scraper)
+            self._free_slot()
+            raise
+        if self._closed:
+            # The pool was closed while this browser was starting
+            self._scrapers.discard(scraper)
+            await scraper.cleanup()
+            raise RuntimeError("Browser pool is closed")
+        return scraper
+    
+    async def release(self, scraper: Optional[PlaylistScraper]) -> None:
+        """Return a scraper to the pool, dropping it if its browser is no longer usable."""
+        if scraper is None:
+            return
+        if self._closed:
+            # close() already ran; shut the browser down instead of parking it
+            self._scrapers.discard(scraper)
+            await scraper.cleanup()
+            return
+        try:
+            await scraper._run(lambda: scraper.browser.current_url)
+        except Exception:
+            logger.warning("Discarding pooled scraper with an unresponsive browser")
+            self._scrapers.discard(scraper)
+            await scraper.cleanup()
+            self._free_slot()
+            return
+        if self._closed:
+            # close() ran during the check above
+            await scraper.cleanup()
+            return
+        self._idle.put_nowait(scraper)
+    
+    def _free_slot(self) -> None:
+        """Hand a slot whose scraper is gone to the next caller, who starts a new browser in it."""
+        self._idle.put_nowait(None)
+    
+    async def close(self) -> None:
+        """Shut down every browser the pool started, including ones still checked out."""
+        self._closed = True
+        scrapers, self._scrapers = self._scrapers, set()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        # Wake callers waiting for a scraper so they see the pool is closed
+        self._free_slot()
+        for scraper in scrapers:
+            await scraper.cleanup()
+
+
+BROWSER_POOL = BrowserPool(size=int(os.getenv("SCRAPER_POOL_SIZE", "2")))
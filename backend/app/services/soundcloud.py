@@ -1,22 +1,64 @@
 import logging
 from typing import Dict, List, Optional
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import asyncio
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz
 from urllib.parse import quote
 from datetime import datetime
 import re
+import uuid
 import os
-from backend.app.services.utils import timeout_context, CircuitBreaker, RateLimiter, retry_with_exponential_backoff
-from webdriver_manager.chrome import ChromeDriverManager
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from backend.app.services.utils import normalize_text, timeout_context, CircuitBreaker, RateLimiter, retry_with_exponential_backoff
 from selenium.webdriver.chrome.service import Service
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by _clean_input, compiled once instead of on every search
+_NOISE_WORDS_RE = re.compile(
+    r'official\s+(audio|video|music\s+video)|explicit|clean|premium|deluxe|'
+    r'album\s+version|radio\s+edit|original\s+mix|ft\.|feat\.|featuring',
+    re.IGNORECASE
+)
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-\'&,.]')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Artist-name splitting/normalizing and word tokens for match scoring
+_ARTIST_SEPARATORS_RE = re.compile(r'[,&/]')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WORD_RE = re.compile(r'\w+')
+
+# Search result list selectors, most specific first
+_RESULT_SELECTORS = [
+    "ul.lazyLoadingList__list li.searchList__item",  # Main search results
+    "ul.soundList__list li.soundList__item",         # Alternative layout
+    "li[role='listitem']"                            # Generic list items
+]
+
+# Returns the elements of the first selector that matches anything, in one round-trip
+_FIRST_MATCH_JS = """
+    for (const selector of arguments[0]) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length) return Array.from(elements);
+    }
+    return null;
+"""
+
+# Result markup selectors, compiled once; each list is tried in order
+_TITLE_SELS = [CSSSelector('a.soundTitle__title span'), CSSSelector('a[aria-label]'), CSSSelector('.soundTitle__title')]
+_URL_SELS = [CSSSelector('a.soundTitle__title'), CSSSelector('a[aria-label]'), CSSSelector('a[href*="/tracks/"]')]
+_USER_SELS = [CSSSelector('.soundTitle__username'), CSSSelector('a[href*="/"]')]
+
+def _select_one(tree, selectors):
+    """Return the first element matched by the first selector that matches anything."""
+    for selector in selectors:
+        matches = selector(tree)
+        if matches:
+            return matches[0]
+    return None
+
 class SoundCloudService:
     """Service for interacting with SoundCloud."""
     
@@ -54,14 +96,6 @@ class SoundCloudService:
             return
 
         try:
-            # Print the Chrome version for diagnostics
-            import subprocess
-            try:
-                chrome_version = subprocess.check_output(['google-chrome', '--version']).decode('utf-8').strip()
-                logger.info(f"Chrome version: {chrome_version}")
-            except Exception as e:
-                logger.warning(f"Failed to get Chrome version: {str(e)}")
-            
             # Configure Chrome options
             chrome_options = webdriver.ChromeOptions()
             
@@ -85,7 +119,7 @@ class SoundCloudService:
             logger.info("Successfully initialized Chrome browser with Selenium Manager")
             
             # Set basic timeouts
-            self.browser.implicitly_wait(5)  # Use shorter timeouts for better recovery
+            self.browser.implicitly_wait(0)  # No implicit wait; results are awaited explicitly
             self.browser.set_page_load_timeout(60)  # Increased from 20 to handle slower page loads
             self.browser.set_script_timeout(30)  # Increased from 15 for better reliability
             
@@ -120,7 +154,7 @@ class SoundCloudService:
         Returns:
             Dictionary with track information or None if not found
         """
-        search_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        search_id = uuid.uuid4().hex[:12]
         search_stats = {
             'search_id': search_id,
             'start_time': datetime.now(),
@@ -180,13 +214,13 @@ class SoundCloudService:
                 original_artist_name = artist_name
                 artist_name = self._clean_input(artist_name)
                 # Split artist name by various separators
-                artist_names = [a.strip() for a in re.split(r'[,&/]', artist_name) if a.strip()]
+                artist_names = [a.strip() for a in _ARTIST_SEPARATORS_RE.split(artist_name) if a.strip()]
                 # Add the full artist name as well
                 if artist_name not in artist_names:
                     artist_names.append(artist_name)
                 
                 # Add versions without special characters
-                normalized_artist_names = [re.sub(r'[^\w\s]', '', a).strip() for a in artist_names]
+                normalized_artist_names = [_NON_WORD_RE.sub('', a).strip() for a in artist_names]
                 artist_names.extend([a for a in normalized_artist_names if a and a not in artist_names])
             
             # ULTRA-SIMPLIFIED SEARCH STRATEGY:
@@ -264,25 +298,14 @@ class SoundCloudService:
                         except Exception as e:
                             logger.warning(f"[WARN][{search_id}] Couldn't stop page loading: {str(e)}")
                         
-                        # Wait for search results (more reliable approach)
+                        # Wait for search results, checking every selector in a single poll
                         track_elements = []
-                        selectors = [
-                            "ul.lazyLoadingList__list li.searchList__item",  # Main search results
-                            "ul.soundList__list li.soundList__item",         # Alternative layout
-                            "li[role='listitem']"                            # Generic list items
-                        ]
-                        
-                        for selector in selectors:
-                            try:
-                                # Shorter timeout for each selector (5 seconds)
-                                wait = WebDriverWait(self.browser, 5)
-                                elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                                if elements:
-                                    track_elements = elements
-                                    search_stats['page_loaded'] = True
-                                    break
-                            except Exception:
-                                continue
+                        try:
+                            wait = WebDriverWait(self.browser, 5)
+                            track_elements = wait.until(lambda d: d.execute_script(_FIRST_MATCH_JS, _RESULT_SELECTORS))
+                            search_stats['page_loaded'] = True
+                        except TimeoutException:
+                            pass
                         
                         if not track_elements:
                             logger.warning(f"[WARN][{search_id}] No search results found for query: '{search_query}'")
@@ -295,35 +318,34 @@ class SoundCloudService:
                         # CRITICAL FIX: Limit results processing to prevent timeouts
                         max_results = 5  # Only process first 5 results
                         
-                        for element in track_elements[:max_results]:
+                        # Read the markup of every result in one call instead of one command per element
+                        results_html = self.browser.execute_script(
+                            "return arguments[0].map(el => el.innerHTML);", track_elements[:max_results]
+                        ) or []
+                        
+                        for html in results_html:
                             try:
                                 # Extract track details using simplified approach
-                                html = element.get_attribute('innerHTML')
                                 if not html:
                                     continue
                                     
-                                # Parse with BeautifulSoup to avoid complex JS interactions
-                                from bs4 import BeautifulSoup
-                                soup = BeautifulSoup(html, 'html.parser')
+                                # Parse with lxml to avoid complex JS interactions
+                                tree = lxml_html.fromstring(html)
                                 
                                 # Extract track information using various potential formats
                                 # Get track title
-                                title_element = soup.select_one('a.soundTitle__title span') or \
-                                              soup.select_one('a[aria-label]') or \
-                                              soup.select_one('.soundTitle__title')
+                                title_element = _select_one(tree, _TITLE_SELS)
                                 
-                                if not title_element:
+                                if title_element is None:
                                     continue
                                     
-                                title = title_element.get_text().strip() if hasattr(title_element, 'get_text') else \
+                                title = title_element.text_content().strip() or \
                                        title_element.get('aria-label', '').strip()
                                 
                                 # Get track URL
-                                url_element = soup.select_one('a.soundTitle__title') or \
-                                            soup.select_one('a[aria-label]') or \
-                                            soup.select_one('a[href*="/tracks/"]')
+                                url_element = _select_one(tree, _URL_SELS)
                                             
-                                if not url_element or not url_element.get('href'):
+                                if url_element is None or not url_element.get('href'):
                                     continue
                                     
                                 url = url_element.get('href')
@@ -335,10 +357,9 @@ class SoundCloudService:
                                     continue
                                 
                                 # Get username
-                                user_element = soup.select_one('.soundTitle__username') or \
-                                             soup.select_one('a[href*="/"]')
+                                user_element = _select_one(tree, _USER_SELS)
                                              
-                                username = user_element.get_text().strip() if user_element and hasattr(user_element, 'get_text') else "Unknown Artist"
+                                username = user_element.text_content().strip() if user_element is not None else "Unknown Artist"
                                 
                                 # Create track info
                                 track_info = {
@@ -370,10 +391,10 @@ class SoundCloudService:
                             normalized_username = normalize_text(track_info['user']['username'])
                             
                             # Calculate similarity scores
-                            title_similarity = self._similarity(normalized_track_name, normalized_title)
+                            title_similarity = self._calculate_similarity(normalized_track_name, normalized_title)
                             username_similarity = 0
                             if normalized_artist_name:
-                                username_similarity = self._similarity(normalized_artist_name, normalized_username)
+                                username_similarity = self._calculate_similarity(normalized_artist_name, normalized_username)
                             
                             # Weighted combined score - title is more important
                             combined_similarity = (title_similarity * 0.7) + (username_similarity * 0.3)
@@ -458,29 +479,21 @@ class SoundCloudService:
             return ""
         
         # Remove multiple spaces and trim
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Remove common noise words from titles
-        noise_words = [
-            r'official\s+(audio|video|music\s+video)',
-            r'explicit', r'clean', r'premium', r'deluxe', 
-            r'album\s+version', r'radio\s+edit', r'original\s+mix',
-            r'ft\.', r'feat\.', r'featuring'
-        ]
-        
-        for word in noise_words:
-            text = re.sub(r'(?i)' + word, '', text)
+        text = _NOISE_WORDS_RE.sub('', text)
         
         # Remove special characters except those in track names
-        text = re.sub(r'[^\w\s\-\'&,.]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Remove extra spaces again after all replacements
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
         
     def _calculate_similarity(self, a: str, b: str) -> float:
-        """Calculate the similarity between two strings using SequenceMatcher."""
+        """Calculate the similarity between two strings using rapidfuzz."""
         if not a or not b:
             return 0.0
             
@@ -497,16 +510,16 @@ class SoundCloudService:
             short, long = (a, b) if len(a) <= len(b) else (b, a)
             return 0.7 + (0.3 * (len(short) / len(long)))
         
-        # Use SequenceMatcher for fuzzy matching
-        return SequenceMatcher(None, a, b).ratio()
+        # Use rapidfuzz's Levenshtein ratio for fuzzy matching
+        return fuzz.ratio(a, b) / 100.0
 
     def _token_similarity(self, a: str, b: str) -> float:
         """Calculate similarity based on word tokens, not character by character."""
         if not a or not b:
             return 0.0
             
-        a_tokens = set(re.findall(r'\w+', a.lower()))
-        b_tokens = set(re.findall(r'\w+', b.lower()))
+        a_tokens = set(_WORD_RE.findall(a.lower()))
+        b_tokens = set(_WORD_RE.findall(b.lower()))
         
         if not a_tokens or not b_tokens:
             return 0.0
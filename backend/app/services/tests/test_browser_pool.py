@@ -0,0 +1,78 @@
+"""Tests for the shared pool of warm browsers"""
+import asyncio
+import pytest
+from backend.app.services import playlist_scraper
+from backend.app.services.playlist_scraper import BrowserPool
+
+
+class FakeBrowser:
+    current_url = "about:blank"
+
+
+class FakeScraper:
+    """Stands in for PlaylistScraper without starting Chrome."""
+
+    def __init__(self):
+        self.browser = FakeBrowser()
+        self.cleaned_up = False
+
+    async def initialize_browser(self):
+        pass
+
+    async def _run(self, fn, *args):
+        return fn(*args)
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+@pytest.fixture(autouse=True)
+def fake_scraper(monkeypatch):
+    monkeypatch.setattr(playlist_scraper, "PlaylistScraper", FakeScraper)
+
+
+def test_released_scraper_is_reused():
+    async def run():
+        pool = BrowserPool(size=1)
+        first = await pool.acquire()
+        await pool.release(first)
+        return first, await pool.acquire()
+
+    first, second = asyncio.run(run())
+    assert first is second
+
+
+def test_closed_pool_refuses_new_scrapers():
+    async def run():
+        pool = BrowserPool(size=1)
+        await pool.close()
+        await pool.acquire()
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_scraper_released_after_close_is_shut_down():
+    async def run():
+        pool = BrowserPool(size=1)
+        scraper = await pool.acquire()
+        await pool.close()
+        scraper.cleaned_up = False
+        await pool.release(scraper)
+        return pool, scraper
+
+    pool, scraper = asyncio.run(run())
+    assert scraper.cleaned_up
+    assert scraper not in pool._scrapers
+
+
+def test_close_wakes_callers_waiting_for_a_scraper():
+    async def run():
+        pool = BrowserPool(size=1)
+        await pool.acquire()
+        waiters = [asyncio.ensure_future(pool.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        await pool.close()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(run()))
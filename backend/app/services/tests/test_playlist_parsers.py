@@ -0,0 +1,130 @@
+"""Fixture tests for the HTTP (browserless) playlist parsers"""
+import asyncio
+import json
+import pytest
+from backend.app.services.playlist_scraper import PlaylistScraper, _read_apple_music_scripts
+
+APPLE_SERVER_DATA = json.dumps({"data": [{"data": {"sections": [
+    {"itemKind": "containerDetailHeaderLockup", "items": [{"title": "Road Trip"}]},
+    {"itemKind": "trackLockup", "items": [
+        {"title": "Song One", "subtitleLinks": [{"title": "Artist A"}, {"title": "Artist B"}]},
+        {"title": "Song Two", "artistName": "Artist C"},
+        {"title": ""},
+    ]},
+]}}]})
+
+APPLE_JSON_LD = json.dumps({
+    "@context": "https://schema.org",
+    "@type": "MusicPlaylist",
+    "name": "LD Playlist",
+    "track": {"@type": "ItemList", "itemListElement": [
+        {"@type": "ListItem", "item": {"name": "LD Song", "byArtist": {"name": "LD Artist"}}},
+        {"@type": "ListItem", "item": {"name": "No Artist"}},
+    ]},
+})
+
+SPOTIFY_EMBED_HTML = """<html><head></head><body><div id="root"></div>
+<script id="__NEXT_DATA__" type="application/json">%s</script></body></html>""" % json.dumps(
+    {"props": {"pageProps": {"state": {"data": {"entity": {
+        "name": "Embed Mix",
+        "trackList": [
+            {"title": "Track 1", "subtitle": "Artist X, Artist Y"},
+            {"title": "Track 2", "subtitle": ""},
+            {"subtitle": "No title"},
+        ],
+    }}}}}}
+)
+
+
+@pytest.fixture
+def scraper():
+    """Parser methods don't touch the browser, so skip __init__."""
+    return PlaylistScraper.__new__(PlaylistScraper)
+
+
+def test_apple_server_data(scraper):
+    data = scraper._parse_apple_music_server_data(APPLE_SERVER_DATA, [])
+    assert data["name"] == "Road Trip"
+    assert data["tracks"] == [
+        {"name": "Song One", "artists": ["Artist A", "Artist B"], "position": 1},
+        {"name": "Song Two", "artists": ["Artist C"], "position": 2},
+    ]
+    assert data["total_tracks"] == 2
+
+
+def test_apple_bare_list_payload(scraper):
+    """Older pages serialize the page list without the {"data": ...} wrapper"""
+    bare = json.dumps(json.loads(APPLE_SERVER_DATA)["data"])
+    assert len(scraper._parse_apple_music_server_data(bare, [])["tracks"]) == 2
+
+
+def test_apple_falls_back_to_json_ld(scraper):
+    data = scraper._parse_apple_music_server_data(None, [APPLE_JSON_LD])
+    assert data["name"] == "LD Playlist"
+    assert data["tracks"] == [
+        {"name": "LD Song", "artists": ["LD Artist"], "position": 1},
+        {"name": "No Artist", "artists": ["Unknown Artist"], "position": 2},
+    ]
+
+
+@pytest.mark.parametrize("server_data", [
+    '{"data": {"x": 1}}',
+    '[1, 2]',
+    '[{"data": []}]',
+    '[{"data": {"sections": {"not": "a list"}}}]',
+    '[{"data": {"sections": [{"itemKind": "trackLockup", "items": [1, {"title": 5}]}]}}]',
+    'not json',
+    '',
+])
+def test_apple_unexpected_shapes_return_none(scraper, server_data):
+    assert scraper._parse_apple_music_server_data(server_data, ['{"@type": "Thing"}', '{bad']) is None
+
+
+def test_apple_stream_reader_stops_at_server_data():
+    page = (
+        '<html><head><script type="application/ld+json">%s</script></head><body>'
+        '<script id="serialized-server-data">%s</script>' % (APPLE_JSON_LD, APPLE_SERVER_DATA)
+    ).encode() + b"<div>" * 100000
+
+    class Content:
+        def __init__(self):
+            self.chunks_read = 0
+
+        async def iter_chunked(self, size):
+            for start in range(0, len(page), size):
+                self.chunks_read += 1
+                yield page[start:start + size]
+
+    class Response:
+        charset = "utf-8"
+        content = Content()
+
+    server_data, ld_blocks = asyncio.run(_read_apple_music_scripts(Response()))
+    assert json.loads(server_data) == json.loads(APPLE_SERVER_DATA)
+    assert [json.loads(b) for b in ld_blocks] == [json.loads(APPLE_JSON_LD)]
+    # The trailing markup is never read
+    assert Response.content.chunks_read == 1
+
+
+def test_spotify_embed(scraper):
+    data = scraper._parse_spotify_embed_data(SPOTIFY_EMBED_HTML)
+    assert data["name"] == "Embed Mix"
+    assert data["tracks"] == [
+        {"name": "Track 1", "artists": ["Artist X", "Artist Y"], "position": 1},
+        {"name": "Track 2", "artists": ["Unknown Artist"], "position": 2},
+    ]
+
+
+@pytest.mark.parametrize("next_data", [
+    "[]",
+    '{"props": []}',
+    '{"props": {"pageProps": {"state": {"data": {"entity": null}}}}}',
+    "{not json",
+])
+def test_spotify_unexpected_shapes_return_none(scraper, next_data):
+    html = '<html><body><script id="__NEXT_DATA__">%s</script></body></html>' % next_data
+    assert scraper._parse_spotify_embed_data(html) is None
+
+
+def test_spotify_missing_script(scraper):
+    assert scraper._parse_spotify_embed_data("<html><body><p>nothing</p></body></html>") is None
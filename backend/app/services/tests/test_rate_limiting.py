@@ -0,0 +1,145 @@
+"""Tests for HostRateLimiter and the rate-limited HTTP fetch"""
+import asyncio
+import pytest
+from backend.app.services import utils
+from backend.app.services import playlist_scraper
+from backend.app.services.utils import HostRateLimiter
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record asyncio.sleep delays instead of waiting, advancing a fake wall clock."""
+    now = [1_700_000_000.0]
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(utils.time, "time", lambda: now[0])
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def test_retry_after_spaces_only_that_host(sleeps):
+    """Retry-After delays the next request to the same host, not to others"""
+    limiter = HostRateLimiter()
+    assert limiter.update("a.example", 429, {"Retry-After": "2"}) == 2.0
+
+    asyncio.run(limiter.wait("b.example"))
+    assert sleeps == []
+
+    asyncio.run(limiter.wait("a.example"))
+    assert sleeps == [pytest.approx(2.0)]
+
+    # The window has passed; no further wait
+    asyncio.run(limiter.wait("a.example"))
+    assert len(sleeps) == 1
+
+
+def test_ratelimit_headers_when_remaining_is_zero(sleeps):
+    """X-RateLimit-Reset is honoured only when the remaining quota is exhausted"""
+    limiter = HostRateLimiter()
+    assert limiter.update("a.example", 200, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "30"}) is None
+    assert limiter.update("a.example", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}) == 30.0
+    # Epoch-style reset values are converted to a relative delay
+    reset_at = str(int(utils.time.time()) + 12)
+    assert limiter.update("b.example", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_at}) == pytest.approx(12.0)
+
+
+def test_delay_is_capped(sleeps):
+    """No single wait exceeds max_delay"""
+    limiter = HostRateLimiter(max_delay=5.0)
+    assert limiter.update("a.example", 429, {"Retry-After": "3600"}) == 5.0
+    asyncio.run(limiter.wait("a.example"))
+    assert sleeps == [pytest.approx(5.0)]
+
+
+def test_bare_429_still_backs_off(sleeps):
+    """A 429 without headers still waits a little before the next request"""
+    limiter = HostRateLimiter()
+    assert limiter.update("a.example", 429, {}) == 1.0
+    assert limiter.update("a.example", 200, {}) is None
+
+
+def test_backoff_delay_grows_exponentially(monkeypatch):
+    """5xx backoff doubles per attempt plus up to a second of jitter, capped at max_delay"""
+    monkeypatch.setattr(utils.random, "random", lambda: 0.5)
+    limiter = HostRateLimiter(max_delay=60.0)
+    assert [limiter.backoff_delay(n) for n in range(4)] == [1.5, 2.5, 4.5, 8.5]
+    assert limiter.backoff_delay(10) == 60.5
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def session(monkeypatch, sleeps):
+    """Route _http_get through a scripted session and a fresh limiter."""
+    holder = {}
+
+    async def get_session():
+        return holder["session"]
+
+    monkeypatch.setattr(playlist_scraper, "get_http_session", get_session)
+    monkeypatch.setattr(playlist_scraper, "_HOST_LIMITER", HostRateLimiter())
+    monkeypatch.setattr(utils.random, "random", lambda: 0.0)
+
+    def use(*responses):
+        holder["session"] = FakeSession(responses)
+        return holder["session"]
+    return use
+
+
+def test_http_get_retries_after_429(session, sleeps):
+    """A 429 is waited out per Retry-After and the request retried"""
+    fake = session(FakeResponse(429, {"Retry-After": "3"}), FakeResponse(200, body="ok"))
+    assert asyncio.run(playlist_scraper._http_get("https://a.example/x")) == (200, "ok")
+    assert fake.calls == 2
+    assert sleeps == [pytest.approx(3.0)]
+
+
+def test_http_get_backs_off_on_5xx(session, sleeps):
+    """Server errors are retried with exponential backoff"""
+    fake = session(FakeResponse(503), FakeResponse(502), FakeResponse(200, body="ok"))
+    assert asyncio.run(playlist_scraper._http_get("https://a.example/x")) == (200, "ok")
+    assert fake.calls == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_http_get_gives_up_after_max_attempts(session, sleeps):
+    """Persistent failures return the last status with no body"""
+    fake = session(*[FakeResponse(500) for _ in range(playlist_scraper._HTTP_MAX_ATTEMPTS)])
+    assert asyncio.run(playlist_scraper._http_get("https://a.example/x")) == (500, None)
+    assert fake.calls == playlist_scraper._HTTP_MAX_ATTEMPTS
+
+
+def test_http_get_does_not_retry_client_errors(session, sleeps):
+    """A 404 fails straight away"""
+    fake = session(FakeResponse(404))
+    assert asyncio.run(playlist_scraper._http_get("https://a.example/x")) == (404, None)
+    assert fake.calls == 1
+    assert sleeps == []
@@ -0,0 +1,117 @@
+"""Tests for sharing one scrape between concurrent requests for the same playlist"""
+import asyncio
+import pytest
+from backend.app.services import playlist_scraper
+from backend.app.services.playlist_scraper import PlaylistScraper
+
+URL = "https://open.spotify.com/playlist/single-flight-test"
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    """get_playlist_data only reaches the browser through _scrape_playlist_data, so skip __init__."""
+    monkeypatch.setattr(playlist_scraper, "_cache_lookup", lambda key: None)
+    return PlaylistScraper.__new__(PlaylistScraper)
+
+
+def test_concurrent_requests_share_one_scrape(scraper, monkeypatch):
+    calls = []
+
+    async def fake_scrape(url, cache_key, platform, search_id):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return {"name": "Shared", "tracks": [{"name": "Song"}]}
+
+    monkeypatch.setattr(scraper, "_scrape_playlist_data", fake_scrape)
+
+    async def run():
+        return await asyncio.gather(*(scraper.get_playlist_data(URL) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r == {"name": "Shared", "tracks": [{"name": "Song"}]} for r in results)
+    # Every caller gets its own copy
+    assert len({id(r) for r in results}) == 5
+    assert playlist_scraper._INFLIGHT == {}
+
+
+def test_waiters_see_the_scrape_failure(scraper, monkeypatch):
+    async def fake_scrape(url, cache_key, platform, search_id):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(scraper, "_scrape_playlist_data", fake_scrape)
+
+    async def run():
+        return await asyncio.gather(
+            *(scraper.get_playlist_data(URL) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert playlist_scraper._INFLIGHT == {}
+
+
+def test_waiter_takes_over_a_cancelled_scrape(scraper, monkeypatch):
+    calls = []
+
+    async def fake_scrape(url, cache_key, platform, search_id):
+        calls.append(url)
+        await asyncio.sleep(0.05 if len(calls) == 1 else 0.01)
+        return {"name": "Retry", "tracks": []}
+
+    monkeypatch.setattr(scraper, "_scrape_playlist_data", fake_scrape)
+
+    async def run():
+        leader = asyncio.ensure_future(scraper.get_playlist_data(URL))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(scraper.get_playlist_data(URL))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await waiter
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return result
+
+    assert asyncio.run(run()) == {"name": "Retry", "tracks": []}
+    assert len(calls) == 2
+    assert playlist_scraper._INFLIGHT == {}
+
+
+def test_http_fast_path_never_borrows_a_browser(scraper, monkeypatch):
+    async def fail_acquire():
+        raise AssertionError("the pool should not be touched")
+
+    async def fake_http(url):
+        return {"name": "Embed", "tracks": [{"name": "Song"}]}
+
+    monkeypatch.setattr(playlist_scraper, "_cache_store", lambda key, value: None)
+    monkeypatch.setattr(playlist_scraper.BROWSER_POOL, "acquire", fail_acquire)
+    monkeypatch.setattr(scraper, "_fetch_spotify_embed_http", fake_http)
+
+    assert asyncio.run(scraper.get_playlist_data(URL))["name"] == "Embed"
+
+
+def test_browser_fallback_returns_the_pooled_scraper(scraper, monkeypatch):
+    pooled = PlaylistScraper.__new__(PlaylistScraper)
+    released = []
+
+    async def fake_acquire():
+        return pooled
+
+    async def fake_release(s):
+        released.append(s)
+
+    async def no_http(url):
+        return None
+
+    async def fake_browser_scrape(url, cache_key, platform, search_id):
+        return {"name": "Browser", "tracks": []}
+
+    monkeypatch.setattr(playlist_scraper.BROWSER_POOL, "acquire", fake_acquire)
+    monkeypatch.setattr(playlist_scraper.BROWSER_POOL, "release", fake_release)
+    monkeypatch.setattr(scraper, "_fetch_spotify_embed_http", no_http)
+    monkeypatch.setattr(pooled, "_scrape_in_browser", fake_browser_scrape)
+
+    assert asyncio.run(scraper.get_playlist_data(URL))["name"] == "Browser"
+    assert released == [pooled]
@@ -0,0 +1,84 @@
+"""Tests for TTLCache expiry and LRU eviction"""
+import pytest
+from backend.app.services import utils
+from backend.app.services.utils import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic inside utils."""
+    now = [1000.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value(clock):
+    """A stored value is returned until its TTL runs out"""
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_entry_expires_after_ttl(clock):
+    """Entries are dropped once their TTL has passed"""
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.2
+    assert cache.get("a") is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_set_restarts_ttl(clock):
+    """Storing a key again gives it a fresh TTL"""
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    clock[0] += 8
+    cache.set("a", 2)
+    clock[0] += 8
+    assert cache.get("a") == 2
+
+
+def test_evicts_least_recently_stored_at_max_size(clock):
+    """Storing past max_size evicts the oldest entry first"""
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_get_refreshes_recency(clock):
+    """A hit moves the entry to the back of the eviction order"""
+    cache = TTLCache(ttl=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_unbounded_by_default(clock):
+    """Without max_size nothing is evicted"""
+    cache = TTLCache(ttl=10)
+    for i in range(500):
+        cache.set(i, i)
+    assert cache.get_stats()["size"] == 500
+    assert cache.get_stats()["evictions"] == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    """An entry stored with its own TTL expires on that instead of the cache's"""
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1, ttl=2)
+    cache.set("b", 2)
+    clock[0] += 3
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
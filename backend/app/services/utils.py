@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import random
 import time
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Callable, Any, Optional, TypeVar, Generic, AsyncContextManager
 from contextlib import asynccontextmanager
+from collections import OrderedDict
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -229,6 +232,177 @@ class RateLimiter:
             'burst_size': self.burst,
         }
 
+class HostRateLimiter:
+    """
+    Per-host limiter driven by the rate-limit headers the server sends back.
+    
+    Instead of guessing a request rate up front, each response's Retry-After or
+    X-RateLimit-Remaining/X-RateLimit-Reset headers set the earliest time the
+    next request to that host may go out.
+    """
+    
+    def __init__(self, max_delay: float = 60.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_delay: Upper bound in seconds on any single wait
+        """
+        self.max_delay = max_delay
+        self._not_before = {}
+        self._lock = asyncio.Lock()
+        self.stats = {
+            'waits': 0,
+            'throttled_responses': 0,
+        }
+    
+    async def wait(self, host: str) -> None:
+        """
+        Sleep until the host is allowed another request.
+        
+        Args:
+            host: Host name the request is going to
+        """
+        async with self._lock:
+            delay = self._not_before.get(host, 0.0) - time.time()
+        if delay > 0:
+            self.stats['waits'] += 1
+            await asyncio.sleep(min(delay, self.max_delay))
+    
+    def update(self, host: str, status: int, headers: Any) -> Optional[float]:
+        """
+        Record the rate-limit state reported by a response.
+        
+        Args:
+            host: Host name the response came from
+            status: HTTP status code
+            headers: Response headers mapping
+            
+        Returns:
+            Seconds until the host may be called again, or None if unthrottled
+        """
+        delay = self._parse_retry_after(headers.get('Retry-After'))
+        if delay is None and headers.get('X-RateLimit-Remaining') == '0':
+            delay = self._parse_reset(headers.get('X-RateLimit-Reset'))
+        if delay is None and status == 429:
+            delay = 1.0
+        if delay is None:
+            return None
+        
+        delay = max(0.0, min(delay, self.max_delay))
+        self.stats['throttled_responses'] += 1
+        self._not_before[host] = max(self._not_before.get(host, 0.0), time.time() + delay)
+        return delay
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with jitter for server errors (5xx).
+        
+        Args:
+            attempt: Zero-based retry attempt
+        """
+        return min(self.max_delay, 2 ** attempt) + random.random()
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        # Retry-After is either delta-seconds or an HTTP date
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _parse_reset(value: Optional[str]) -> Optional[float]:
+        # X-RateLimit-Reset is an epoch timestamp on most APIs, seconds-to-reset on others
+        try:
+            reset = float(value)
+        except (TypeError, ValueError):
+            return None
+        return reset - time.time() if reset > 1e9 else reset
+    
+    def get_stats(self) -> dict:
+        """Get the current statistics of the limiter."""
+        return {
+            **self.stats,
+            'throttled_hosts': len(self._not_before),
+        }
+
+class TTLCache(Generic[T]):
+    """
+    In-process cache whose entries expire a fixed time after they are stored.
+    
+    Expired entries are dropped lazily, when they are next looked up. When
+    max_size is set, storing past it evicts the least recently used entry.
+    """
+    
+    def __init__(self, ttl: float = 3600.0, max_size: Optional[int] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Time in seconds an entry stays valid after it is stored
+            max_size: Maximum number of entries kept, or None for no limit
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+    
+    def get(self, key: Any) -> Optional[T]:
+        """
+        Look up a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self.stats['hits'] += 1
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        self.stats['misses'] += 1
+        return None
+    
+    def set(self, key: Any, value: T, ttl: Optional[float] = None) -> None:
+        """
+        Store a value for the configured TTL.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time in seconds this entry stays valid, instead of the configured TTL
+        """
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        if self.max_size is not None and len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+    
+    def get_stats(self) -> dict:
+        """Get the current statistics of the cache."""
+        return {
+            **self.stats,
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+        }
+
 async def retry_with_exponential_backoff(
     func: Callable,
     max_retries: int = 3,
@@ -8,9 +8,11 @@ setup(
         "fastapi",
         "uvicorn",
         "selenium",
-        "webdriver-manager",
-        "beautifulsoup4",
+        "lxml",
+        "cssselect",
         "spotipy",
+        "rapidfuzz",
+        "orjson",
         "requests",
         "aiohttp",
         "asyncio",